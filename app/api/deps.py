@@ -2,24 +2,137 @@
 
 from __future__ import annotations
 
-from fastapi import HTTPException, Request
-from supabase import Client, create_client
+import hashlib
+import time
+from functools import lru_cache
 
+from fastapi import Depends, HTTPException, Request
+from jose import JWTError, jwt
+from supabase import Client, ClientOptions, create_client
+
+from app.core.cache import TTLCache
 from app.core.config import get_settings
+from app.repositories.review_repo import ReviewRepository
+from app.repositories.summary_repo import SummaryRepository
+from app.services.review_service import ReviewService
+from app.services.summary_service import SummaryService
+
+# Validated users keyed by token hash, so repeated requests with the same
+# bearer token skip the Supabase Auth round-trip.
+_TOKEN_CACHE_TTL = 30.0
+_token_cache: TTLCache[str, dict] = TTLCache(maxsize=10_000, ttl=_TOKEN_CACHE_TTL)
 
 
+@lru_cache(maxsize=1)
 def get_supabase_client() -> Client:
-    """Create and return a Supabase client using application settings."""
+    """Return the shared Supabase client using application settings.
+
+    The client (and its underlying HTTP connection pool) is created once
+    and reused across requests. It must not be used for calls that mutate
+    the auth session; use ``create_auth_client`` for those.
+    """
     settings = get_settings()
     return create_client(settings.supabase_url, settings.supabase_anon_key)
 
 
+def create_auth_client() -> Client:
+    """Create a fresh Supabase client for session-mutating auth calls.
+
+    ``sign_up``, ``sign_in_with_password`` and ``sign_out`` store the
+    session on the client instance, so they must not share the cached
+    client used for data access.
+    """
+    settings = get_settings()
+    return create_client(settings.supabase_url, settings.supabase_anon_key)
+
+
+def create_user_client(token: str) -> Client:
+    """Create a Supabase client whose requests run as the token's user.
+
+    RLS policies and ``auth.uid()`` only see the caller when their JWT is
+    sent; the shared client always sends the anon key. A fresh client is
+    built per request so the token never leaks into the shared one.
+    """
+    settings = get_settings()
+    options = ClientOptions()
+    options.headers["Authorization"] = f"Bearer {token}"
+    return create_client(settings.supabase_url, settings.supabase_anon_key, options)
+
+
+def get_review_service() -> ReviewService:
+    """Return a ReviewService backed by the shared Supabase client."""
+    return ReviewService(ReviewRepository(get_supabase_client()))
+
+
+def get_summary_service() -> SummaryService:
+    """Return a SummaryService backed by the shared Supabase client."""
+    client = get_supabase_client()
+    return SummaryService(SummaryRepository(client), ReviewRepository(client))
+
+
 async def get_current_user(request: Request) -> dict:
     """Extract and validate JWT from the Authorization header.
 
     Returns the authenticated user information from Supabase.
     Raises HTTPException(401) if the token is missing or invalid.
     """
+    token = _bearer_token(request)
+    cache_key = _token_cache_key(token)
+    cached_user = _token_cache.get(cache_key)
+    if cached_user is not None:
+        # Callers get their own copy; the cached entry is shared.
+        return dict(cached_user)
+
+    try:
+        user_response = get_supabase_client().auth.get_user(token)
+    except Exception as exc:
+        raise HTTPException(
+            status_code=401,
+            detail=f"Token validation failed: {str(exc)}",
+        ) from exc
+
+    if user_response is None or user_response.user is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid or expired token",
+        )
+
+    user = user_response.user
+    current_user = {
+        "id": str(user.id),
+        "email": user.email,
+        "created_at": str(user.created_at) if user.created_at else None,
+    }
+
+    ttl = _token_cache_ttl(token)
+    if ttl > 0:
+        _token_cache.set(cache_key, dict(current_user), ttl=ttl)
+    return current_user
+
+
+async def get_user_supabase_client(
+    request: Request,
+    _: dict = Depends(get_current_user),
+) -> Client:
+    """Return a per-request Supabase client authenticated as the caller.
+
+    Depends on ``get_current_user`` so the token is validated first.
+    """
+    return create_user_client(_bearer_token(request))
+
+
+def get_user_review_service(
+    client: Client = Depends(get_user_supabase_client),
+) -> ReviewService:
+    """Return a ReviewService whose writes run as the authenticated caller."""
+    return ReviewService(ReviewRepository(client))
+
+
+def _bearer_token(request: Request) -> str:
+    """Return the JWT-shaped bearer token from the Authorization header.
+
+    Raises HTTPException(401) if the header is missing, empty or malformed.
+    """
     auth_header = request.headers.get("Authorization")
     if not auth_header or not auth_header.startswith("Bearer "):
         raise HTTPException(
@@ -34,27 +147,48 @@ async def get_current_user(request: Request) -> dict:
             detail="Empty bearer token",
         )
 
-    try:
-        supabase = get_supabase_client()
-        user_response = supabase.auth.get_user(token)
-        if user_response is None or user_response.user is None:
-            raise HTTPException(
-                status_code=401,
-                detail="Invalid or expired token",
-            )
-        user = user_response.user
-        return {
-            "id": str(user.id),
-            "email": user.email,
-            "created_at": str(user.created_at) if user.created_at else None,
-        }
-    except HTTPException:
-        raise
-    except Exception as exc:
+    if not _is_jwt_shaped(token):
         raise HTTPException(
             status_code=401,
-            detail=f"Token validation failed: {str(exc)}",
-        ) from exc
+            detail="Malformed bearer token",
+        )
+    return token
+
+
+def _is_jwt_shaped(token: str) -> bool:
+    """Return whether ``token`` looks like a JWT, without verifying it.
+
+    Lets obviously invalid tokens be rejected locally instead of costing
+    a round-trip to Supabase Auth.
+    """
+    if token.count(".") != 2:
+        return False
+    try:
+        jwt.get_unverified_header(token)
+    except JWTError:
+        return False
+    return True
+
+
+def invalidate_cached_token(token: str) -> None:
+    """Drop a bearer token from the validation cache (e.g. on logout)."""
+    _token_cache.pop(_token_cache_key(token))
+
+
+def _token_cache_key(token: str) -> str:
+    """Return the cache key for a bearer token (never store raw tokens)."""
+    return hashlib.sha256(token.encode()).hexdigest()[:32]
+
+
+def _token_cache_ttl(token: str) -> float:
+    """Return how long a validated token may be cached, bounded by its ``exp`` claim."""
+    try:
+        exp = jwt.get_unverified_claims(token).get("exp")
+    except JWTError:
+        return 0.0
+    if not isinstance(exp, (int, float)):
+        return _TOKEN_CACHE_TTL
+    return min(_TOKEN_CACHE_TTL, exp - time.time())
 
 
 async def get_optional_user(request: Request) -> dict | None:
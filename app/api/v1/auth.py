@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
-from app.api.deps import get_current_user, get_supabase_client
+from app.api.deps import create_auth_client, get_current_user, invalidate_cached_token
 from app.dto.user import TokenResponse, UserCreate, UserLogin, UserResponse
 
 router = APIRouter()
@@ -13,7 +13,7 @@ router = APIRouter()
 @router.post("/signup", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
 async def signup(user_data: UserCreate) -> TokenResponse:
     """Register a new user with email and password via Supabase Auth."""
-    supabase = get_supabase_client()
+    supabase = create_auth_client()
 
     try:
         response = supabase.auth.sign_up(
@@ -55,7 +55,7 @@ async def signup(user_data: UserCreate) -> TokenResponse:
 @router.post("/login", response_model=TokenResponse)
 async def login(user_data: UserLogin) -> TokenResponse:
     """Login with email and password via Supabase Auth."""
-    supabase = get_supabase_client()
+    supabase = create_auth_client()
 
     try:
         response = supabase.auth.sign_in_with_password(
@@ -90,10 +90,14 @@ async def login(user_data: UserLogin) -> TokenResponse:
 
 @router.post("/logout", status_code=status.HTTP_200_OK)
 async def logout(
+    request: Request,
     current_user: dict = Depends(get_current_user),
 ) -> dict:
     """Logout the current user. Requires authentication."""
-    supabase = get_supabase_client()
+    token = request.headers["Authorization"].removeprefix("Bearer ").strip()
+    invalidate_cached_token(token)
+
+    supabase = create_auth_client()
 
     try:
         supabase.auth.sign_out()
@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-
-from app.api.deps import get_current_user, get_supabase_client
+from fastapi.responses import StreamingResponse
+
+from app.api.deps import (
+    get_current_user,
+    get_review_service,
+    get_summary_service,
+    get_supabase_client,
+    get_user_review_service,
+)
 from app.dto.review import ReviewCreate, ReviewListResponse, ReviewResponse
 from app.dto.summary import SummaryResponse
+from app.services.review_service import ReviewService
+from app.services.summary_service import SummaryService
 
 router = APIRouter()
 
@@ -18,31 +29,37 @@ async def list_reviews(
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(10, ge=1, le=100, description="Items per page"),
     category: str | None = Query(None, description="Filter by category"),
+    cursor: str | None = Query(
+        None, description="next_cursor from the previous page (keyset pagination)"
+    ),
+    service: ReviewService = Depends(get_review_service),
 ) -> ReviewListResponse:
-    """List reviews with pagination and optional category filter."""
-    supabase = get_supabase_client()
+    """List reviews with pagination and optional category filter.
 
-    offset = (page - 1) * per_page
+    Passing the previous page's ``next_cursor`` as ``cursor`` continues
+    from that page without an ``OFFSET`` scan.
+    """
+    return service.list_reviews(
+        page=page, per_page=per_page, category=category, cursor=cursor
+    )
 
-    # Build query for items
-    query = supabase.table("reviews").select("*", count="exact")
-    if category:
-        query = query.eq("category", category)
 
-    query = query.order("created_at", desc=True)
-    query = query.range(offset, offset + per_page - 1)
+@router.get("/export", response_class=StreamingResponse)
+async def export_reviews(
+    category: str | None = Query(None, description="Filter by category"),
+    service: ReviewService = Depends(get_review_service),
+) -> StreamingResponse:
+    """Export all reviews as newline-delimited JSON.
 
-    response = query.execute()
+    Rows are fetched from Supabase in batches and streamed as they arrive,
+    so memory use does not grow with the size of the export.
+    """
 
-    items = [ReviewResponse(**row) for row in (response.data or [])]
-    total = response.count if response.count is not None else len(items)
+    def ndjson_lines() -> Iterator[bytes]:
+        for row in service.export(category=category):
+            yield orjson.dumps(row) + b"\n"
 
-    return ReviewListResponse(
-        items=items,
-        total=total,
-        page=page,
-        per_page=per_page,
-    )
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
 
 
 @router.get("/{review_id}", response_model=ReviewResponse)
@@ -74,8 +91,11 @@ async def create_review(
     """Create a new review. Requires authentication."""
     supabase = get_supabase_client()
 
-    insert_data = review_data.model_dump()
-    insert_data["author_id"] = current_user["id"]
+    # Omit unset optional fields; Postgres fills in their NULL defaults.
+    insert_data = {
+        **review_data.model_dump(exclude_none=True),
+        "author_id": current_user["id"],
+    }
 
     response = (
         supabase.table("reviews")
@@ -92,102 +112,21 @@ async def create_review(
     return ReviewResponse(**response.data[0])
 
 
-@router.delete("/{review_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete("/{review_id}", status_code=status.HTTP_204_NO_CONTENT, response_model=None)
 async def delete_review(
     review_id: UUID,
     current_user: dict = Depends(get_current_user),
+    service: ReviewService = Depends(get_user_review_service),
 ) -> None:
     """Delete a review. Requires authentication and must be the author."""
-    supabase = get_supabase_client()
-
-    # Fetch the review to verify ownership
-    existing = (
-        supabase.table("reviews")
-        .select("*")
-        .eq("id", str(review_id))
-        .execute()
-    )
-
-    if not existing.data:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Review with id '{review_id}' not found",
-        )
-
-    review = existing.data[0]
-    if review.get("author_id") != current_user["id"]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only delete your own reviews",
-        )
-
-    supabase.table("reviews").delete().eq("id", str(review_id)).execute()
+    service.delete_review(review_id, UUID(current_user["id"]))
 
 
 @router.post("/{review_id}/summarize", response_model=SummaryResponse)
 async def summarize_review(
     review_id: UUID,
     current_user: dict = Depends(get_current_user),
+    service: SummaryService = Depends(get_summary_service),
 ) -> SummaryResponse:
     """Trigger AI summary generation for a review. Requires authentication."""
-    supabase = get_supabase_client()
-
-    # Fetch the review
-    review_response = (
-        supabase.table("reviews")
-        .select("*")
-        .eq("id", str(review_id))
-        .execute()
-    )
-
-    if not review_response.data:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Review with id '{review_id}' not found",
-        )
-
-    review = review_response.data[0]
-
-    # Check if summary already exists
-    if review.get("summary_id"):
-        existing_summary = (
-            supabase.table("summaries")
-            .select("*")
-            .eq("id", review["summary_id"])
-            .execute()
-        )
-        if existing_summary.data:
-            return SummaryResponse(**existing_summary.data[0])
-
-    # Placeholder AI summary generation
-    # In production, this would call an AI service (OpenAI, Gemini, etc.)
-    summary_data = {
-        "summary": f"AI-generated summary of: {review['title']}. {review['content'][:200]}...",
-        "sentiment": "neutral",
-        "sentiment_score": 0.0,
-        "keywords": [],
-        "pros": [],
-        "cons": [],
-        "ai_model": "placeholder",
-    }
-
-    summary_response = (
-        supabase.table("summaries")
-        .insert(summary_data)
-        .execute()
-    )
-
-    if not summary_response.data:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create summary",
-        )
-
-    summary = summary_response.data[0]
-
-    # Link summary to review
-    supabase.table("reviews").update(
-        {"summary_id": summary["id"]}
-    ).eq("id", str(review_id)).execute()
-
-    return SummaryResponse(**summary)
+    return service.summarize_review(review_id)
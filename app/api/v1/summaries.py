@@ -11,6 +11,9 @@ from app.dto.summary import SummaryResponse
 
 router = APIRouter()
 
+# List pages select only the columns SummaryResponse exposes.
+_SUMMARY_LIST_COLUMNS = ",".join(SummaryResponse.model_fields)
+
 
 @router.get("/{summary_id}", response_model=SummaryResponse)
 async def get_summary(summary_id: UUID) -> SummaryResponse:
@@ -45,7 +48,7 @@ async def list_summaries(
 
     response = (
         supabase.table("summaries")
-        .select("*")
+        .select(_SUMMARY_LIST_COLUMNS)
         .order("created_at", desc=True)
         .range(offset, offset + per_page - 1)
         .execute()
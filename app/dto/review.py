@@ -57,3 +57,6 @@ class ReviewListResponse(BaseModel):
     total: int = Field(..., ge=0, description="Total number of reviews")
     page: int = Field(..., ge=1, description="Current page number")
     per_page: int = Field(..., ge=1, description="Number of items per page")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page, or null on the last page"
+    )
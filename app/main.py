@@ -4,14 +4,14 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 
 from app.api.v1.router import api_v1_router
 from app.core.config import get_settings
 from app.core.exceptions import AppException
-from app.pages.views import pages_router
+from app.pages.views import pages_router, templates
+from app.services.ai_service import close_http_client
 
 
 @asynccontextmanager
@@ -20,6 +20,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     settings = get_settings()
     print(f"Starting Review Summary Platform [{settings.app_env}]")
     yield
+    await close_http_client()
     print("Shutting down Review Summary Platform")
 
 
@@ -32,6 +33,7 @@ def create_app() -> FastAPI:
         description="AI-powered review summary and analysis platform",
         version="0.1.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url="/docs" if settings.is_development else None,
         redoc_url="/redoc" if settings.is_development else None,
     )
@@ -40,7 +42,6 @@ def create_app() -> FastAPI:
     app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
     # Templates
-    templates = Jinja2Templates(directory="app/templates")
     app.state.templates = templates
 
     # API routers
@@ -51,8 +52,8 @@ def create_app() -> FastAPI:
 
     # Exception handler
     @app.exception_handler(AppException)
-    async def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
-        return JSONResponse(
+    async def app_exception_handler(request: Request, exc: AppException) -> ORJSONResponse:
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={"error": exc.message, "detail": exc.detail},
         )
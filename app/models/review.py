@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime
+from functools import partial
 from typing import Any, Optional
 from uuid import UUID, uuid4
 
+from pydantic import TypeAdapter
 
-@dataclass
+
+@dataclass(slots=True)
 class Review:
     """Domain model representing a review."""
 
@@ -20,64 +23,38 @@ class Review:
     source: Optional[str] = None
     author_id: Optional[UUID] = None
     summary_id: Optional[UUID] = None
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=partial(datetime.now, UTC))
+    updated_at: datetime = field(default_factory=partial(datetime.now, UTC))
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Review:
         """Create a Review instance from a dictionary.
 
+        Parsing and type coercion are delegated to pydantic-core, so
+        unknown keys are ignored and missing optional fields fall back
+        to their dataclass defaults.
+
         Args:
             data: Dictionary containing review fields. UUID and datetime
                   values can be strings or native types.
 
         Returns:
             A new Review instance.
+
+        Raises:
+            pydantic.ValidationError: If required fields are missing or
+                values cannot be coerced to the field types.
         """
-        return cls(
-            id=UUID(data["id"]) if isinstance(data.get("id"), str) else data.get("id", uuid4()),
-            title=data["title"],
-            content=data["content"],
-            category=data["category"],
-            rating=data.get("rating"),
-            source=data.get("source"),
-            author_id=(
-                UUID(data["author_id"])
-                if isinstance(data.get("author_id"), str)
-                else data.get("author_id")
-            ),
-            summary_id=(
-                UUID(data["summary_id"])
-                if isinstance(data.get("summary_id"), str)
-                else data.get("summary_id")
-            ),
-            created_at=(
-                datetime.fromisoformat(data["created_at"])
-                if isinstance(data.get("created_at"), str)
-                else data.get("created_at", datetime.now())
-            ),
-            updated_at=(
-                datetime.fromisoformat(data["updated_at"])
-                if isinstance(data.get("updated_at"), str)
-                else data.get("updated_at", datetime.now())
-            ),
-        )
+        return _REVIEW_ADAPTER.validate_python(data)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert the Review instance to a dictionary.
 
         Returns:
             Dictionary with all review fields, UUIDs and datetimes as strings.
+            Aware UTC datetimes are rendered with a trailing ``Z``.
         """
-        return {
-            "id": str(self.id),
-            "title": self.title,
-            "content": self.content,
-            "category": self.category,
-            "rating": self.rating,
-            "source": self.source,
-            "author_id": str(self.author_id) if self.author_id else None,
-            "summary_id": str(self.summary_id) if self.summary_id else None,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-        }
+        return _REVIEW_ADAPTER.dump_python(self, mode="json")
+
+
+_REVIEW_ADAPTER: TypeAdapter[Review] = TypeAdapter(Review)
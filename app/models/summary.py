@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime
+from functools import partial
 from typing import Any, List, Optional
 from uuid import UUID, uuid4
 
+from pydantic import TypeAdapter
 
-@dataclass
+
+@dataclass(slots=True)
 class Summary:
     """Domain model representing an AI-generated review summary."""
 
@@ -20,49 +23,37 @@ class Summary:
     pros: List[str] = field(default_factory=list)
     cons: List[str] = field(default_factory=list)
     ai_model: Optional[str] = None
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=partial(datetime.now, UTC))
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Summary:
         """Create a Summary instance from a dictionary.
 
+        Parsing and type coercion are delegated to pydantic-core, so
+        unknown keys are ignored and missing optional fields fall back
+        to their dataclass defaults.
+
         Args:
             data: Dictionary containing summary fields. UUID and datetime
                   values can be strings or native types.
 
         Returns:
             A new Summary instance.
+
+        Raises:
+            pydantic.ValidationError: If required fields are missing or
+                values cannot be coerced to the field types.
         """
-        return cls(
-            id=UUID(data["id"]) if isinstance(data.get("id"), str) else data.get("id", uuid4()),
-            summary=data["summary"],
-            sentiment=data["sentiment"],
-            sentiment_score=float(data["sentiment_score"]),
-            keywords=data.get("keywords", []),
-            pros=data.get("pros", []),
-            cons=data.get("cons", []),
-            ai_model=data.get("ai_model"),
-            created_at=(
-                datetime.fromisoformat(data["created_at"])
-                if isinstance(data.get("created_at"), str)
-                else data.get("created_at", datetime.now())
-            ),
-        )
+        return _SUMMARY_ADAPTER.validate_python(data)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert the Summary instance to a dictionary.
 
         Returns:
             Dictionary with all summary fields, UUIDs and datetimes as strings.
+            Aware UTC datetimes are rendered with a trailing ``Z``.
         """
-        return {
-            "id": str(self.id),
-            "summary": self.summary,
-            "sentiment": self.sentiment,
-            "sentiment_score": self.sentiment_score,
-            "keywords": self.keywords,
-            "pros": self.pros,
-            "cons": self.cons,
-            "ai_model": self.ai_model,
-            "created_at": self.created_at.isoformat(),
-        }
+        return _SUMMARY_ADAPTER.dump_python(self, mode="json")
+
+
+_SUMMARY_ADAPTER: TypeAdapter[Summary] = TypeAdapter(Summary)
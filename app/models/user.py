@@ -3,48 +3,51 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime
+from functools import partial
 from typing import Any
 from uuid import UUID, uuid4
 
+from pydantic import TypeAdapter
 
-@dataclass
+
+@dataclass(slots=True)
 class User:
     """Domain model representing a user."""
 
     email: str
     id: UUID = field(default_factory=uuid4)
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=partial(datetime.now, UTC))
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> User:
         """Create a User instance from a dictionary.
 
+        Parsing and type coercion are delegated to pydantic-core, so
+        unknown keys are ignored and missing optional fields fall back
+        to their dataclass defaults.
+
         Args:
             data: Dictionary containing user fields. UUID and datetime
                   values can be strings or native types.
 
         Returns:
             A new User instance.
+
+        Raises:
+            pydantic.ValidationError: If required fields are missing or
+                values cannot be coerced to the field types.
         """
-        return cls(
-            id=UUID(data["id"]) if isinstance(data.get("id"), str) else data.get("id", uuid4()),
-            email=data["email"],
-            created_at=(
-                datetime.fromisoformat(data["created_at"])
-                if isinstance(data.get("created_at"), str)
-                else data.get("created_at", datetime.now())
-            ),
-        )
+        return _USER_ADAPTER.validate_python(data)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert the User instance to a dictionary.
 
         Returns:
             Dictionary with all user fields, UUIDs and datetimes as strings.
+            Aware UTC datetimes are rendered with a trailing ``Z``.
         """
-        return {
-            "id": str(self.id),
-            "email": self.email,
-            "created_at": self.created_at.isoformat(),
-        }
+        return _USER_ADAPTER.dump_python(self, mode="json")
+
+
+_USER_ADAPTER: TypeAdapter[User] = TypeAdapter(User)
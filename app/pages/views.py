@@ -2,47 +2,57 @@
 
 from __future__ import annotations
 
-from uuid import UUID
-
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Path, Request
 from fastapi.responses import HTMLResponse
+from fastapi.templating import Jinja2Templates
+
+from app.core.config import get_settings
 
 pages_router = APIRouter(tags=["pages"])
 
+templates = Jinja2Templates(directory="app/templates")
+# Compiled templates are cached by the Jinja environment; only re-stat
+# the files on every lookup when templates may change under us.
+templates.env.auto_reload = get_settings().is_development
+
+# Canonical textual UUID. Page routes only echo the ID into the template,
+# so it is validated by shape instead of being parsed into a UUID object.
+_UUID_PATTERN = (
+    r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+)
+
 
 @pages_router.get("/", response_class=HTMLResponse)
 async def index(request: Request) -> HTMLResponse:
     """Landing / dashboard page."""
-    templates = request.app.state.templates
     return templates.TemplateResponse("index.html", {"request": request})
 
 
 @pages_router.get("/reviews", response_class=HTMLResponse)
 async def reviews_list(request: Request) -> HTMLResponse:
     """Review list page."""
-    templates = request.app.state.templates
     return templates.TemplateResponse("reviews/list.html", {"request": request})
 
 
 @pages_router.get("/reviews/new", response_class=HTMLResponse)
 async def reviews_create(request: Request) -> HTMLResponse:
     """Create review page."""
-    templates = request.app.state.templates
     return templates.TemplateResponse("reviews/create.html", {"request": request})
 
 
 @pages_router.get("/summaries/{summary_id}", response_class=HTMLResponse)
-async def summary_detail(request: Request, summary_id: UUID) -> HTMLResponse:
+async def summary_detail(
+    request: Request,
+    summary_id: str = Path(..., pattern=_UUID_PATTERN),
+) -> HTMLResponse:
     """Summary detail page."""
-    templates = request.app.state.templates
     return templates.TemplateResponse(
         "summaries/detail.html",
-        {"request": request, "summary_id": str(summary_id)},
+        {"request": request, "summary_id": summary_id},
     )
 
 
 @pages_router.get("/analytics", response_class=HTMLResponse)
 async def analytics_dashboard(request: Request) -> HTMLResponse:
     """Analytics dashboard page."""
-    templates = request.app.state.templates
     return templates.TemplateResponse("analytics/dashboard.html", {"request": request})
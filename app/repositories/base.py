@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import Any, List, Optional, Tuple
+from typing import Any, List, Literal, Optional, Tuple
 from uuid import UUID
 
+# PostgREST count strategy for paginated queries. ``None`` skips counting
+# entirely; ``"planned"`` uses the planner's row estimate.
+CountMode = Optional[Literal["exact", "planned", "estimated"]]
+
 
 class BaseRepository(ABC):
     """Abstract base repository defining CRUD interface.
@@ -13,8 +17,14 @@ class BaseRepository(ABC):
     Provides common data access methods for Supabase tables. Subclasses
     should call ``super().__init__`` with the appropriate table name and
     an authenticated Supabase client instance.
+
+    Subclasses may narrow :attr:`list_columns` so paginated queries do not
+    fetch columns that list callers never read.
     """
 
+    #: PostgREST select list used by paginated queries.
+    list_columns: str = "*"
+
     def __init__(self, table_name: str, supabase_client: Any) -> None:
         self.table_name = table_name
         self.client = supabase_client
@@ -41,6 +51,8 @@ class BaseRepository(ABC):
         self,
         page: int = 1,
         per_page: int = 20,
+        count: CountMode = "planned",
+        columns: Optional[str] = None,
         **filters: Any,
     ) -> Tuple[List[dict], int]:
         """Get paginated records with optional equality filters.
@@ -48,26 +60,64 @@ class BaseRepository(ABC):
         Args:
             page: 1-based page number.
             per_page: Number of records per page.
+            count: PostgREST count strategy. ``"exact"`` runs a full
+                   ``COUNT(*)`` over the filtered set; ``None`` skips
+                   counting (see :meth:`_resolve_total`).
+            columns: PostgREST select list; defaults to
+                     :attr:`list_columns`.
             **filters: Column-name / value pairs used as equality filters.
                        ``None`` values are silently skipped.
 
         Returns:
             A tuple of (list-of-record-dicts, total-count).
         """
-        query = self.client.table(self.table_name).select("*", count="exact")
+        query = self.client.table(self.table_name).select(
+            columns or self.list_columns, count=count
+        )
 
         for key, value in filters.items():
             if value is not None:
                 query = query.eq(key, value)
 
         offset = (page - 1) * per_page
-        query = query.range(offset, offset + per_page - 1).order(
-            "created_at", desc=True
+        query = (
+            query.range(offset, offset + per_page - 1)
+            .order("created_at", desc=True)
+            .order("id", desc=True)
         )
 
         response = query.execute()
-        total = response.count if response.count is not None else len(response.data)
-        return response.data or [], total
+        data = response.data or []
+        return data, self._resolve_total(response.count, data, offset, per_page)
+
+    @staticmethod
+    def _resolve_total(
+        count: Optional[int],
+        data: List[dict],
+        offset: int,
+        per_page: int,
+    ) -> int:
+        """Return the total row count for a paginated response.
+
+        When no count was requested, the total is estimated from the page
+        itself: a full page reports one extra page's worth of rows so that
+        callers still render a "next" link.
+
+        Args:
+            count: Count reported by PostgREST, if any.
+            data: Rows returned for the current page.
+            offset: Offset of the first row on the page.
+            per_page: Requested page size.
+
+        Returns:
+            The reported or estimated total.
+        """
+        if count is not None:
+            return count
+        total = offset + len(data)
+        if len(data) == per_page:
+            total += per_page
+        return total
 
     def create(self, data: dict) -> dict:
         """Create a new record.
@@ -2,15 +2,66 @@
 
 from __future__ import annotations
 
-from typing import Any, List, Tuple
+import base64
+import binascii
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
 from uuid import UUID
 
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, CountMode
+
+# Queries shorter than this keep the substring (ILIKE) search; longer ones
+# use the GIN-indexed ``search_tsv`` column (see migration 004).
+_FTS_MIN_QUERY_LENGTH = 3
+
+
+def encode_cursor(row: dict) -> str:
+    """Return an opaque keyset cursor positioned just after *row*.
+
+    Args:
+        row: A review record containing ``created_at`` and ``id``.
+
+    Returns:
+        A URL-safe cursor string for :meth:`ReviewRepository.get_after`.
+    """
+    raw = f"{row['created_at']}|{row['id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """Decode a cursor produced by :func:`encode_cursor`.
+
+    Both parts are parsed and re-rendered so that only well-formed values
+    are ever interpolated into a PostgREST filter.
+
+    Args:
+        cursor: Cursor string supplied by the client.
+
+    Returns:
+        A tuple of (ISO-8601 ``created_at``, review ``id``).
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError) as exc:
+        raise ValueError("Malformed cursor") from exc
+
+    created_at, _, row_id = raw.partition("|")
+    return datetime.fromisoformat(created_at).isoformat(), str(UUID(row_id))
 
 
 class ReviewRepository(BaseRepository):
     """Data access layer for the ``reviews`` table."""
 
+    # Every column except the ``search_tsv`` index column.
+    list_columns = (
+        "id,title,content,category,rating,source,"
+        "author_id,summary_id,created_at,updated_at"
+    )
+
     def __init__(self, client: Any) -> None:
         super().__init__("reviews", client)
 
@@ -19,6 +70,8 @@ class ReviewRepository(BaseRepository):
         category: str,
         page: int = 1,
         per_page: int = 20,
+        count: CountMode = "planned",
+        columns: Optional[str] = None,
     ) -> Tuple[List[dict], int]:
         """Get paginated reviews filtered by category.
 
@@ -26,17 +79,27 @@ class ReviewRepository(BaseRepository):
             category: Review category to filter on.
             page: 1-based page number.
             per_page: Number of records per page.
+            count: PostgREST count strategy (see ``BaseRepository.get_all``).
+            columns: PostgREST select list; defaults to ``list_columns``.
 
         Returns:
             A tuple of (list-of-record-dicts, total-count).
         """
-        return self.get_all(page=page, per_page=per_page, category=category)
+        return self.get_all(
+            page=page,
+            per_page=per_page,
+            count=count,
+            columns=columns,
+            category=category,
+        )
 
     def get_by_author(
         self,
         author_id: UUID,
         page: int = 1,
         per_page: int = 20,
+        count: CountMode = "planned",
+        columns: Optional[str] = None,
     ) -> Tuple[List[dict], int]:
         """Get paginated reviews filtered by author.
 
@@ -44,39 +107,221 @@ class ReviewRepository(BaseRepository):
             author_id: UUID of the review author.
             page: 1-based page number.
             per_page: Number of records per page.
+            count: PostgREST count strategy (see ``BaseRepository.get_all``).
+            columns: PostgREST select list; defaults to ``list_columns``.
 
         Returns:
             A tuple of (list-of-record-dicts, total-count).
         """
-        return self.get_all(page=page, per_page=per_page, author_id=str(author_id))
+        return self.get_all(
+            page=page,
+            per_page=per_page,
+            count=count,
+            columns=columns,
+            author_id=str(author_id),
+        )
+
+    def get_with_summary(
+        self,
+        review_id: UUID,
+        columns: str = "*",
+    ) -> Optional[dict]:
+        """Get a review together with its linked summary in one request.
+
+        The summary is embedded by PostgREST through the ``summary_id``
+        foreign key, so callers that need both rows avoid a second lookup.
+
+        Args:
+            review_id: UUID of the review.
+            columns: PostgREST select list for the review's own columns.
+
+        Returns:
+            The review record with a ``summary`` key holding the linked
+            summary record (or ``None``), or ``None`` if the review does
+            not exist.
+        """
+        response = (
+            self.client.table(self.table_name)
+            .select(f"{columns}, summary:summaries(*)")
+            .eq("id", str(review_id))
+            .execute()
+        )
+        return response.data[0] if response.data else None
+
+    def update_if_author(
+        self,
+        review_id: UUID,
+        author_id: UUID,
+        data: dict,
+    ) -> Optional[dict]:
+        """Update a review only if it belongs to *author_id*.
+
+        The ownership check and the write happen in a single
+        ``UPDATE ... WHERE id = ? AND author_id = ? RETURNING *``.
+
+        Args:
+            review_id: UUID of the review to update.
+            author_id: UUID the review's ``author_id`` must match.
+            data: Column-name / value mapping with fields to change.
+
+        Returns:
+            The updated record, or ``None`` if no review matched both the
+            ID and the author.
+        """
+        response = (
+            self.client.table(self.table_name)
+            .update(data)
+            .eq("id", str(review_id))
+            .eq("author_id", str(author_id))
+            .execute()
+        )
+        return response.data[0] if response.data else None
+
+    def delete_if_author(self, review_id: UUID, author_id: UUID) -> bool:
+        """Delete a review only if it belongs to *author_id*.
+
+        Args:
+            review_id: UUID of the review to delete.
+            author_id: UUID the review's ``author_id`` must match.
+
+        Returns:
+            ``True`` if a row was deleted, ``False`` if no review matched
+            both the ID and the author.
+        """
+        response = (
+            self.client.table(self.table_name)
+            .delete()
+            .eq("id", str(review_id))
+            .eq("author_id", str(author_id))
+            .execute()
+        )
+        return len(response.data) > 0
+
+    def get_after(
+        self,
+        cursor: Optional[str],
+        per_page: int = 20,
+        columns: Optional[str] = None,
+        **filters: Any,
+    ) -> Tuple[List[dict], int]:
+        """Get the page of reviews following *cursor* (keyset pagination).
+
+        Rows are ordered by ``(created_at, id)`` descending and the page is
+        located with a ``WHERE (created_at, id) < cursor`` predicate, so
+        deep pages cost the same as the first one (no ``OFFSET`` scan).
+
+        Args:
+            cursor: Cursor from :func:`encode_cursor`, or ``None`` for the
+                    first page.
+            per_page: Number of records per page.
+            columns: PostgREST select list; defaults to ``list_columns``.
+            **filters: Column-name / value pairs used as equality filters.
+                       ``None`` values are silently skipped.
+
+        Returns:
+            A tuple of (list-of-record-dicts, estimated-total). No count is
+            requested; see ``BaseRepository._resolve_total``.
+
+        Raises:
+            ValueError: If *cursor* is malformed.
+        """
+        query = self.client.table(self.table_name).select(columns or self.list_columns)
+
+        for key, value in filters.items():
+            if value is not None:
+                query = query.eq(key, value)
+
+        if cursor is not None:
+            created_at, row_id = decode_cursor(cursor)
+            query = query.or_(
+                f'created_at.lt."{created_at}",'
+                f'and(created_at.eq."{created_at}",id.lt.{row_id})'
+            )
+
+        response = (
+            query.order("created_at", desc=True)
+            .order("id", desc=True)
+            .limit(per_page)
+            .execute()
+        )
+        data = response.data or []
+        return data, self._resolve_total(None, data, 0, per_page)
+
+    def iter_all(
+        self,
+        batch_size: int = 500,
+        columns: Optional[str] = None,
+        **filters: Any,
+    ) -> Iterator[dict]:
+        """Yield every matching review, fetching ``batch_size`` rows at a time.
+
+        Intended for exports: memory stays bounded by one batch. Batches are
+        read with :meth:`get_after`, so each one seeks past the previous
+        batch's last row instead of scanning an ``OFFSET``, and rows inserted
+        during the export cannot shift later batches.
+
+        Args:
+            batch_size: Number of rows fetched per PostgREST request.
+            columns: PostgREST select list; defaults to ``list_columns``.
+                     Must include ``created_at`` and ``id``.
+            **filters: Column-name / value pairs used as equality filters.
+                       ``None`` values are silently skipped.
+
+        Yields:
+            Review dictionaries, newest first.
+        """
+        cursor: Optional[str] = None
+        while True:
+            rows, _ = self.get_after(
+                cursor, per_page=batch_size, columns=columns, **filters
+            )
+            yield from rows
+            if len(rows) < batch_size:
+                return
+            cursor = encode_cursor(rows[-1])
 
     def search(
         self,
         query: str,
         page: int = 1,
         per_page: int = 20,
+        count: CountMode = "planned",
+        columns: Optional[str] = None,
     ) -> Tuple[List[dict], int]:
-        """Full-text search across review title and content using ``ilike``.
+        """Full-text search across review title and content.
+
+        Queries of at least ``_FTS_MIN_QUERY_LENGTH`` characters are matched
+        as words against the indexed ``search_tsv`` column using web-search
+        syntax. Shorter queries fall back to a case-insensitive ``ilike``
+        substring match.
 
         Args:
-            query: Search string (case-insensitive partial match).
+            query: Search string.
             page: 1-based page number.
             per_page: Number of records per page.
+            count: PostgREST count strategy (see ``BaseRepository.get_all``).
+            columns: PostgREST select list; defaults to ``list_columns``.
 
         Returns:
             A tuple of (list-of-record-dicts, total-count).
         """
-        pattern = f"%{query}%"
         offset = (page - 1) * per_page
 
-        search_query = (
-            self.client.table(self.table_name)
-            .select("*", count="exact")
-            .or_(f"title.ilike.{pattern},content.ilike.{pattern}")
-            .order("created_at", desc=True)
-            .range(offset, offset + per_page - 1)
+        search_query = self.client.table(self.table_name).select(
+            columns or self.list_columns, count=count
+        )
+        if len(query.strip()) >= _FTS_MIN_QUERY_LENGTH:
+            search_query = search_query.filter("search_tsv", "wfts(simple)", query)
+        else:
+            pattern = f"%{query}%"
+            search_query = search_query.or_(
+                f"title.ilike.{pattern},content.ilike.{pattern}"
+            )
+
+        search_query = search_query.order("created_at", desc=True).range(
+            offset, offset + per_page - 1
         )
 
         response = search_query.execute()
-        total = response.count if response.count is not None else len(response.data)
-        return response.data or [], total
+        data = response.data or []
+        return data, self._resolve_total(response.count, data, offset, per_page)
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any, List, Tuple
+from typing import Any, List, Optional, Tuple
 
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, CountMode
 
 
 class SummaryRepository(BaseRepository):
@@ -18,6 +18,8 @@ class SummaryRepository(BaseRepository):
         sentiment: str,
         page: int = 1,
         per_page: int = 20,
+        count: CountMode = "planned",
+        columns: Optional[str] = None,
     ) -> Tuple[List[dict], int]:
         """Get paginated summaries filtered by sentiment.
 
@@ -26,8 +28,16 @@ class SummaryRepository(BaseRepository):
                        (``positive``, ``negative``, ``neutral``, or ``mixed``).
             page: 1-based page number.
             per_page: Number of records per page.
+            count: PostgREST count strategy (see ``BaseRepository.get_all``).
+            columns: PostgREST select list; defaults to ``list_columns``.
 
         Returns:
             A tuple of (list-of-record-dicts, total-count).
         """
-        return self.get_all(page=page, per_page=per_page, sentiment=sentiment)
+        return self.get_all(
+            page=page,
+            per_page=per_page,
+            count=count,
+            columns=columns,
+            sentiment=sentiment,
+        )
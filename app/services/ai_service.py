@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import json
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import httpx
+import orjson
 
 from app.core.config import get_settings
 from app.core.exceptions import AIServiceException
@@ -27,17 +27,46 @@ _SYSTEM_PROMPT = (
     "Respond ONLY with valid JSON. Do not include markdown fences."
 )
 
-_USER_PROMPT_TEMPLATE = (
-    "Analyze this review:\n"
-    "Title: {title}\n"
-    "Content: {content}\n\n"
-    "Provide: 1) Brief summary 2) Sentiment (positive/negative/neutral/mixed) "
-    "3) Sentiment score (-1.0 to 1.0) 4) Keywords 5) Pros 6) Cons\n\n"
-    "Respond in JSON format."
-)
+
+def _render_user_prompt(title: str, content: str) -> str:
+    """Render the per-review user prompt shared by both providers."""
+    return (
+        "Analyze this review:\n"
+        f"Title: {title}\n"
+        f"Content: {content}\n\n"
+        "Provide: 1) Brief summary 2) Sentiment (positive/negative/neutral/mixed) "
+        "3) Sentiment score (-1.0 to 1.0) 4) Keywords 5) Pros 6) Cons\n\n"
+        "Respond in JSON format."
+    )
+
 
 _REQUEST_TIMEOUT = 30.0
 
+# Shared connection pool so repeated AI calls reuse warm TCP/TLS
+# connections instead of handshaking on every request.
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=_REQUEST_TIMEOUT,
+            limits=_HTTP_LIMITS,
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client. Called on application shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 class AIService:
     """Generates AI summaries using OpenAI or Gemini APIs."""
@@ -90,28 +119,27 @@ class AIService:
         Returns:
             Parsed ``SummaryCreate`` from the model response.
         """
-        user_prompt = _USER_PROMPT_TEMPLATE.format(title=title, content=content)
+        user_prompt = _render_user_prompt(title, content)
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://api.openai.com/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.settings.openai_api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "model": "gpt-4o-mini",
-                        "messages": [
-                            {"role": "system", "content": _SYSTEM_PROMPT},
-                            {"role": "user", "content": user_prompt},
-                        ],
-                        "response_format": {"type": "json_object"},
-                        "temperature": 0.3,
-                    },
-                    timeout=_REQUEST_TIMEOUT,
-                )
-                response.raise_for_status()
+            response = await _get_http_client().post(
+                "https://api.openai.com/v1/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {self.settings.openai_api_key}",
+                    "Content-Type": "application/json",
+                },
+                json={
+                    "model": "gpt-4o-mini",
+                    "messages": [
+                        {"role": "system", "content": _SYSTEM_PROMPT},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    "response_format": {"type": "json_object"},
+                    "temperature": 0.3,
+                },
+                timeout=_REQUEST_TIMEOUT,
+            )
+            response.raise_for_status()
 
             data = response.json()
             raw_text = data["choices"][0]["message"]["content"]
@@ -129,7 +157,9 @@ class AIService:
             raise AIServiceException(
                 "Failed to connect to OpenAI API"
             ) from exc
-        except (KeyError, IndexError, json.JSONDecodeError) as exc:
+        # ValueError covers both httpx's stdlib JSON decoding of the body
+        # and orjson's decoding of the model output.
+        except (KeyError, IndexError, ValueError) as exc:
             logger.error("Failed to parse OpenAI response: %s", exc)
             raise AIServiceException(
                 "Failed to parse AI response"
@@ -153,7 +183,7 @@ class AIService:
         Returns:
             Parsed ``SummaryCreate`` from the model response.
         """
-        user_prompt = _USER_PROMPT_TEMPLATE.format(title=title, content=content)
+        user_prompt = _render_user_prompt(title, content)
         full_prompt = f"{_SYSTEM_PROMPT}\n\n{user_prompt}"
 
         url = (
@@ -163,22 +193,21 @@ class AIService:
         )
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    headers={"Content-Type": "application/json"},
-                    json={
-                        "contents": [
-                            {"parts": [{"text": full_prompt}]},
-                        ],
-                        "generationConfig": {
-                            "temperature": 0.3,
-                            "responseMimeType": "application/json",
-                        },
+            response = await _get_http_client().post(
+                url,
+                headers={"Content-Type": "application/json"},
+                json={
+                    "contents": [
+                        {"parts": [{"text": full_prompt}]},
+                    ],
+                    "generationConfig": {
+                        "temperature": 0.3,
+                        "responseMimeType": "application/json",
                     },
-                    timeout=_REQUEST_TIMEOUT,
-                )
-                response.raise_for_status()
+                },
+                timeout=_REQUEST_TIMEOUT,
+            )
+            response.raise_for_status()
 
             data = response.json()
             raw_text = data["candidates"][0]["content"]["parts"][0]["text"]
@@ -196,7 +225,7 @@ class AIService:
             raise AIServiceException(
                 "Failed to connect to Gemini API"
             ) from exc
-        except (KeyError, IndexError, json.JSONDecodeError) as exc:
+        except (KeyError, IndexError, ValueError) as exc:
             logger.error("Failed to parse Gemini response: %s", exc)
             raise AIServiceException(
                 "Failed to parse AI response"
@@ -220,9 +249,10 @@ class AIService:
             A dictionary suitable for constructing a ``SummaryCreate``.
 
         Raises:
-            json.JSONDecodeError: If ``raw_text`` is not valid JSON.
+            orjson.JSONDecodeError: If ``raw_text`` is not valid JSON. This
+                is a subclass of ``json.JSONDecodeError``.
         """
-        parsed: Dict[str, Any] = json.loads(raw_text)
+        parsed: Dict[str, Any] = orjson.loads(raw_text)
 
         # Ensure required fields have sensible defaults.
         summary = parsed.get("summary", "")
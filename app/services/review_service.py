@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from collections.abc import Iterator
+from typing import NoReturn, Optional
 from uuid import UUID
 
-from app.core.exceptions import AuthorizationException, NotFoundException
+from pydantic import TypeAdapter
+
+from app.core.exceptions import (
+    AuthorizationException,
+    NotFoundException,
+    ValidationException,
+)
 from app.dto.review import (
     ReviewCreate,
     ReviewListResponse,
     ReviewResponse,
 )
-from app.repositories.review_repo import ReviewRepository
+from app.repositories.review_repo import ReviewRepository, encode_cursor
+
+_review_list_adapter = TypeAdapter(list[ReviewResponse])
 
 
 class ReviewService:
@@ -34,7 +43,7 @@ class ReviewService:
         Returns:
             The newly created review as a response DTO.
         """
-        review_data = data.model_dump()
+        review_data = data.model_dump(exclude_none=True)
         if author_id:
             review_data["author_id"] = str(author_id)
         result = self.repo.create(review_data)
@@ -62,32 +71,63 @@ class ReviewService:
         page: int = 1,
         per_page: int = 20,
         category: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> ReviewListResponse:
         """List reviews with pagination and optional category filter.
 
+        When ``cursor`` is given, keyset pagination is used and ``page`` is
+        only echoed back; ``total`` is then an estimate. Every full page
+        carries a ``next_cursor`` that continues from its last item.
+
         Args:
-            page: 1-based page number.
+            page: 1-based page number (offset pagination).
             per_page: Number of items per page.
             category: Optional category to filter by.
+            cursor: Optional ``next_cursor`` from a previous page.
 
         Returns:
             Paginated list of reviews.
+
+        Raises:
+            ValidationException: If ``cursor`` is malformed.
         """
-        if category:
+        if cursor is not None:
+            try:
+                items, total = self.repo.get_after(
+                    cursor, per_page=per_page, category=category
+                )
+            except ValueError as exc:
+                raise ValidationException("Invalid pagination cursor") from exc
+        elif category:
             items, total = self.repo.get_by_category(
                 category, page=page, per_page=per_page
             )
         else:
             items, total = self.repo.get_all(page=page, per_page=per_page)
 
-        reviews = [ReviewResponse(**item) for item in items]
+        reviews = _review_list_adapter.validate_python(items)
         return ReviewListResponse(
             items=reviews,
             total=total,
             page=page,
             per_page=per_page,
+            next_cursor=encode_cursor(items[-1]) if len(items) == per_page else None,
         )
 
+    def export(self, category: Optional[str] = None) -> Iterator[dict]:
+        """Iterate over every review for a bulk export, newest first.
+
+        Rows are fetched lazily in batches, so memory use does not grow
+        with the number of reviews.
+
+        Args:
+            category: Optional category to filter by.
+
+        Returns:
+            An iterator over raw review records.
+        """
+        return self.repo.iter_all(category=category)
+
     def update_review(
         self,
         review_id: UUID,
@@ -96,6 +136,10 @@ class ReviewService:
     ) -> ReviewResponse:
         """Update an existing review. Only the author may update.
 
+        The ownership check and update are a single conditional write; the
+        review is only looked up again to tell a missing review from one
+        owned by someone else.
+
         Args:
             review_id: UUID of the review to update.
             data: Dictionary of fields to update.
@@ -108,18 +152,9 @@ class ReviewService:
             NotFoundException: If the review does not exist.
             AuthorizationException: If the user is not the author.
         """
-        existing = self.repo.get_by_id(review_id)
-        if existing is None:
-            raise NotFoundException("Review", str(review_id))
-
-        if existing.get("author_id") != str(user_id):
-            raise AuthorizationException(
-                "You do not have permission to update this review"
-            )
-
-        result = self.repo.update(review_id, data)
+        result = self.repo.update_if_author(review_id, user_id, data)
         if result is None:
-            raise NotFoundException("Review", str(review_id))
+            self._raise_missing_or_forbidden(review_id, "update")
         return ReviewResponse(**result)
 
     def delete_review(self, review_id: UUID, user_id: UUID) -> bool:
@@ -136,16 +171,23 @@ class ReviewService:
             NotFoundException: If the review does not exist.
             AuthorizationException: If the user is not the author.
         """
-        existing = self.repo.get_by_id(review_id)
-        if existing is None:
-            raise NotFoundException("Review", str(review_id))
+        if not self.repo.delete_if_author(review_id, user_id):
+            self._raise_missing_or_forbidden(review_id, "delete")
+        return True
 
-        if existing.get("author_id") != str(user_id):
-            raise AuthorizationException(
-                "You do not have permission to delete this review"
-            )
+    def _raise_missing_or_forbidden(self, review_id: UUID, action: str) -> NoReturn:
+        """Explain why a conditional write on *review_id* matched no row.
 
-        return self.repo.delete(review_id)
+        Raises:
+            NotFoundException: If the review does not exist.
+            AuthorizationException: Otherwise, since the caller is not
+                                    the author.
+        """
+        if self.repo.get_by_id(review_id) is None:
+            raise NotFoundException("Review", str(review_id))
+        raise AuthorizationException(
+            f"You do not have permission to {action} this review"
+        )
 
     def search_reviews(
         self,
@@ -164,7 +206,7 @@ class ReviewService:
             Paginated list of matching reviews.
         """
         items, total = self.repo.search(query, page=page, per_page=per_page)
-        reviews = [ReviewResponse(**item) for item in items]
+        reviews = _review_list_adapter.validate_python(items)
         return ReviewListResponse(
             items=reviews,
             total=total,
@@ -11,6 +11,22 @@ from app.repositories.review_repo import ReviewRepository
 from app.repositories.summary_repo import SummaryRepository
 
 
+def _placeholder_summary(review: dict[str, Any]) -> dict[str, Any]:
+    """Build a placeholder summary row for a review's title and content.
+
+    In production, this would call an AI service (OpenAI, Gemini, etc.)
+    """
+    return {
+        "summary": f"AI-generated summary of: {review['title']}. {review['content'][:200]}...",
+        "sentiment": "neutral",
+        "sentiment_score": 0.0,
+        "keywords": [],
+        "pros": [],
+        "cons": [],
+        "ai_model": "placeholder",
+    }
+
+
 class SummaryService:
     """Application service encapsulating summary business rules."""
 
@@ -52,6 +68,30 @@ class SummaryService:
             raise NotFoundException("Summary", str(summary_id))
         return SummaryResponse(**result)
 
+    def summarize_review(self, review_id: UUID) -> SummaryResponse:
+        """Return the review's summary, generating one if none is linked.
+
+        The review and its linked summary (if any) are loaded in one query.
+
+        Args:
+            review_id: UUID of the review to summarize.
+
+        Returns:
+            The existing or newly created summary as a response DTO.
+
+        Raises:
+            NotFoundException: If the review does not exist.
+        """
+        review = self.review_repo.get_with_summary(review_id, columns="title, content")
+        if review is None:
+            raise NotFoundException("Review", str(review_id))
+        if review.get("summary"):
+            return SummaryResponse(**review["summary"])
+
+        summary = self.summary_repo.create(_placeholder_summary(review))
+        self.review_repo.update(review_id, {"summary_id": summary["id"]})
+        return SummaryResponse(**summary)
+
     def link_summary_to_review(
         self,
         review_id: UUID,
@@ -6,6 +6,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from supabase import create_client
 from app.core.config import get_settings
 
+BATCH_SIZE = 500
+
 def seed():
     settings = get_settings()
     supabase = create_client(settings.supabase_url, settings.supabase_service_role_key)
@@ -34,9 +36,12 @@ def seed():
         },
     ]
 
-    for review in reviews:
-        result = supabase.table("reviews").insert(review).execute()
-        print(f"Inserted review: {review['title']}")
+    # One multi-row INSERT per batch instead of one request per review.
+    for start in range(0, len(reviews), BATCH_SIZE):
+        batch = reviews[start:start + BATCH_SIZE]
+        result = supabase.table("reviews").insert(batch).execute()
+        for row in result.data:
+            print(f"Inserted review: {row['title']}")
 
     print(f"Seeded {len(reviews)} reviews successfully.")
 
@@ -0,0 +1,53 @@
+-- Review Summary Platform: Analytics overview
+-- Materializes the whole analytics dashboard payload as a single row,
+-- refreshed every minute by pg_cron, so analytics_overview() is a
+-- constant-time lookup regardless of how many reviews and summaries exist.
+
+CREATE MATERIALIZED VIEW mv_analytics_overview AS
+SELECT
+    1 AS id,
+    json_build_object(
+        'total_reviews', (SELECT count(*) FROM reviews),
+        'avg_rating', (SELECT round(avg(rating), 2) FROM reviews),
+        'category_stats', COALESCE(
+            (
+                SELECT json_agg(c ORDER BY c.category)
+                FROM (
+                    SELECT category, count(*) AS count, round(avg(rating), 2) AS avg_rating
+                    FROM reviews
+                    GROUP BY category
+                ) c
+            ),
+            '[]'::json
+        ),
+        'sentiment_stats', (
+            SELECT json_build_object(
+                'positive', count(*) FILTER (WHERE s.sentiment = 'positive'),
+                'negative', count(*) FILTER (WHERE s.sentiment = 'negative'),
+                'neutral', count(*) FILTER (WHERE s.sentiment = 'neutral'),
+                'mixed', count(*) FILTER (WHERE s.sentiment = 'mixed'),
+                'total', count(s.sentiment)
+            )
+            FROM reviews r
+            JOIN summaries s ON s.id = r.summary_id
+        )
+    ) AS payload;
+
+-- Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX idx_mv_analytics_overview_id ON mv_analytics_overview(id);
+
+CREATE EXTENSION IF NOT EXISTS pg_cron;
+
+SELECT cron.schedule(
+    'refresh_mv_analytics_overview',
+    '* * * * *',
+    'REFRESH MATERIALIZED VIEW CONCURRENTLY mv_analytics_overview'
+);
+
+CREATE OR REPLACE FUNCTION analytics_overview()
+RETURNS json
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT payload FROM mv_analytics_overview WHERE id = 1;
+$$;
@@ -0,0 +1,10 @@
+-- Review Summary Platform: Owner write policies
+-- Authors may modify and delete their own reviews. Without these policies
+-- RLS filters every UPDATE/DELETE on reviews down to zero rows. Requests
+-- must carry the caller's JWT so that auth.uid() identifies them.
+
+CREATE POLICY "reviews_update_own" ON reviews FOR UPDATE
+    USING (auth.uid() = author_id)
+    WITH CHECK (auth.uid() = author_id);
+CREATE POLICY "reviews_delete_own" ON reviews FOR DELETE
+    USING (auth.uid() = author_id);
@@ -0,0 +1,11 @@
+-- Review Summary Platform: Indexed full-text search over reviews
+-- Stores a tsvector of title + content and indexes it with GIN so that
+-- ReviewRepository.search can match words without the sequential scan
+-- forced by leading-wildcard ILIKE patterns. The 'simple' configuration
+-- does no stemming or stop-word removal, so it works for any language.
+
+ALTER TABLE reviews
+    ADD COLUMN search_tsv tsvector
+    GENERATED ALWAYS AS (to_tsvector('simple', title || ' ' || content)) STORED;
+
+CREATE INDEX idx_reviews_search_tsv ON reviews USING GIN (search_tsv);
@@ -1,14 +1,28 @@
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
 from unittest.mock import MagicMock, patch
 
-from app.main import app
 
+def pytest_collection_modifyitems(items):
+    """Run every async test on one session-wide event loop."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def client():
-    """FastAPI test client."""
-    return TestClient(app)
+    """FastAPI test client, shared so the app starts up once per session.
+
+    The app is imported here rather than at module level so runs that never
+    request the client (e.g. ``pytest tests/unit``) skip building it.
+    """
+    from app.main import app
+
+    with TestClient(app) as c:
+        yield c
 
 
 @pytest.fixture
@@ -2,45 +2,70 @@
 
 from __future__ import annotations
 
-import uuid
+from collections.abc import Iterator
+from unittest.mock import MagicMock
+from uuid import UUID
 
 import pytest
 from fastapi.testclient import TestClient
 
-from app.main import app
+from app.api.deps import get_current_user, get_review_service, get_user_review_service
+from app.repositories.review_repo import ReviewRepository
+from app.services.review_service import ReviewService
 
-client = TestClient(app)
+# Well-formed UUID that is never persisted, for not-found / auth paths.
+_NONEXISTENT_ID = "00000000-0000-0000-0000-000000000000"
+_AUTHOR_ID = "11111111-1111-1111-1111-111111111111"
+
+
+@pytest.fixture
+def offline_reviews(client: TestClient, mock_supabase: MagicMock) -> Iterator[None]:
+    """Serve review routes from a mocked Supabase client."""
+    client.app.dependency_overrides[get_review_service] = lambda: ReviewService(
+        ReviewRepository(mock_supabase)
+    )
+    yield
+    client.app.dependency_overrides.pop(get_review_service)
+
+
+@pytest.fixture
+def author_repo(client: TestClient) -> Iterator[MagicMock]:
+    """Act as an authenticated author whose review writes hit a mocked repo."""
+    repo = MagicMock(spec=ReviewRepository)
+    overrides = client.app.dependency_overrides
+    overrides[get_current_user] = lambda: {"id": _AUTHOR_ID}
+    overrides[get_user_review_service] = lambda: ReviewService(repo)
+    yield repo
+    overrides.pop(get_current_user)
+    overrides.pop(get_user_review_service)
 
 
 class TestHealthAndPages:
     """Tests for basic health checks and page rendering."""
 
-    def test_root_page_returns_200(self) -> None:
-        """The landing page should return HTTP 200."""
-        response = client.get("/")
+    @pytest.mark.parametrize("path", ["/", "/reviews", "/reviews/new", "/analytics"])
+    def test_page_returns_200(self, client: TestClient, path: str) -> None:
+        """Each static page should render the base layout with HTTP 200."""
+        response = client.get(path)
         assert response.status_code == 200
         assert "ReviewSummary" in response.text
 
-    def test_reviews_page_returns_200(self) -> None:
-        """The reviews list page should return HTTP 200."""
-        response = client.get("/reviews")
-        assert response.status_code == 200
-
-    def test_reviews_new_page_returns_200(self) -> None:
-        """The create-review page should return HTTP 200."""
-        response = client.get("/reviews/new")
+    def test_summary_detail_page_returns_200(self, client: TestClient) -> None:
+        """The summary detail page should render for a UUID-shaped ID."""
+        response = client.get(f"/summaries/{_NONEXISTENT_ID}")
         assert response.status_code == 200
+        assert _NONEXISTENT_ID in response.text
 
-    def test_analytics_page_returns_200(self) -> None:
-        """The analytics dashboard page should return HTTP 200."""
-        response = client.get("/analytics")
-        assert response.status_code == 200
+    def test_summary_detail_page_invalid_id(self, client: TestClient) -> None:
+        """The summary detail page should reject non-UUID IDs with 422."""
+        response = client.get("/summaries/not-a-uuid")
+        assert response.status_code == 422
 
 
 class TestReviewsAPI:
     """Tests for the /api/v1/reviews endpoints."""
 
-    def test_list_reviews_returns_200(self) -> None:
+    def test_list_reviews_returns_200(self, client: TestClient) -> None:
         """GET /api/v1/reviews should return 200 with a list structure."""
         response = client.get("/api/v1/reviews")
         assert response.status_code == 200
@@ -51,7 +76,7 @@ class TestReviewsAPI:
         assert "per_page" in data
         assert isinstance(data["items"], list)
 
-    def test_list_reviews_with_pagination(self) -> None:
+    def test_list_reviews_with_pagination(self, client: TestClient) -> None:
         """GET /api/v1/reviews should accept pagination query params."""
         response = client.get("/api/v1/reviews?page=1&per_page=5")
         assert response.status_code == 200
@@ -59,14 +84,20 @@ class TestReviewsAPI:
         assert data["page"] == 1
         assert data["per_page"] == 5
 
-    def test_list_reviews_with_category_filter(self) -> None:
+    def test_list_reviews_with_category_filter(self, client: TestClient) -> None:
         """GET /api/v1/reviews should accept a category filter."""
         response = client.get("/api/v1/reviews?category=product")
         assert response.status_code == 200
         data = response.json()
         assert isinstance(data["items"], list)
 
-    def test_create_review_unauthenticated(self) -> None:
+    @pytest.mark.usefixtures("offline_reviews")
+    def test_list_reviews_invalid_cursor(self, client: TestClient) -> None:
+        """GET /api/v1/reviews with a malformed cursor should return 422."""
+        response = client.get("/api/v1/reviews?cursor=not-a-cursor")
+        assert response.status_code == 422
+
+    def test_create_review_unauthenticated(self, client: TestClient) -> None:
         """POST /api/v1/reviews without auth should return 401."""
         payload = {
             "title": "Test Review",
@@ -77,7 +108,7 @@ class TestReviewsAPI:
         response = client.post("/api/v1/reviews", json=payload)
         assert response.status_code == 401
 
-    def test_create_review_missing_auth_header(self) -> None:
+    def test_create_review_missing_auth_header(self, client: TestClient) -> None:
         """POST /api/v1/reviews with no Authorization header should return 401."""
         payload = {
             "title": "Test Review",
@@ -89,7 +120,7 @@ class TestReviewsAPI:
         data = response.json()
         assert "detail" in data
 
-    def test_create_review_invalid_token(self) -> None:
+    def test_create_review_invalid_token(self, client: TestClient) -> None:
         """POST /api/v1/reviews with an invalid token should return 401."""
         payload = {
             "title": "Test Review",
@@ -103,40 +134,60 @@ class TestReviewsAPI:
         )
         assert response.status_code == 401
 
-    def test_get_nonexistent_review(self) -> None:
+    def test_get_nonexistent_review(self, client: TestClient) -> None:
         """GET /api/v1/reviews/<nonexistent-uuid> should return 404."""
-        fake_id = str(uuid.uuid4())
-        response = client.get(f"/api/v1/reviews/{fake_id}")
+        response = client.get(f"/api/v1/reviews/{_NONEXISTENT_ID}")
         assert response.status_code == 404
 
-    def test_get_review_invalid_uuid(self) -> None:
+    def test_get_review_invalid_uuid(self, client: TestClient) -> None:
         """GET /api/v1/reviews/not-a-uuid should return 422."""
         response = client.get("/api/v1/reviews/not-a-uuid")
         assert response.status_code == 422
 
-    def test_delete_review_unauthenticated(self) -> None:
+    def test_delete_review_unauthenticated(self, client: TestClient) -> None:
         """DELETE /api/v1/reviews/<id> without auth should return 401."""
-        fake_id = str(uuid.uuid4())
-        response = client.delete(f"/api/v1/reviews/{fake_id}")
+        response = client.delete(f"/api/v1/reviews/{_NONEXISTENT_ID}")
         assert response.status_code == 401
 
-    def test_summarize_review_unauthenticated(self) -> None:
+    @pytest.mark.parametrize(
+        ("deleted", "existing", "expected_status"),
+        [(True, None, 204), (False, None, 404), (False, {"id": _NONEXISTENT_ID}, 403)],
+        ids=["deleted", "not_found", "forbidden"],
+    )
+    def test_delete_review_outcome(
+        self,
+        client: TestClient,
+        author_repo: MagicMock,
+        deleted: bool,
+        existing: dict | None,
+        expected_status: int,
+    ) -> None:
+        """DELETE /api/v1/reviews/<id> should map the delete outcome to a status."""
+        author_repo.delete_if_author.return_value = deleted
+        author_repo.get_by_id.return_value = existing
+
+        response = client.delete(f"/api/v1/reviews/{_NONEXISTENT_ID}")
+
+        assert response.status_code == expected_status
+        author_repo.delete_if_author.assert_called_once_with(
+            UUID(_NONEXISTENT_ID), UUID(_AUTHOR_ID)
+        )
+
+    def test_summarize_review_unauthenticated(self, client: TestClient) -> None:
         """POST /api/v1/reviews/<id>/summarize without auth should return 401."""
-        fake_id = str(uuid.uuid4())
-        response = client.post(f"/api/v1/reviews/{fake_id}/summarize")
+        response = client.post(f"/api/v1/reviews/{_NONEXISTENT_ID}/summarize")
         assert response.status_code == 401
 
 
 class TestSummariesAPI:
     """Tests for the /api/v1/summaries endpoints."""
 
-    def test_get_nonexistent_summary(self) -> None:
+    def test_get_nonexistent_summary(self, client: TestClient) -> None:
         """GET /api/v1/summaries/<nonexistent-uuid> should return 404."""
-        fake_id = str(uuid.uuid4())
-        response = client.get(f"/api/v1/summaries/{fake_id}")
+        response = client.get(f"/api/v1/summaries/{_NONEXISTENT_ID}")
         assert response.status_code == 404
 
-    def test_list_summaries_returns_200(self) -> None:
+    def test_list_summaries_returns_200(self, client: TestClient) -> None:
         """GET /api/v1/summaries should return 200 with a list."""
         response = client.get("/api/v1/summaries")
         assert response.status_code == 200
@@ -147,17 +198,17 @@ class TestSummariesAPI:
 class TestAuthAPI:
     """Tests for the /api/v1/auth endpoints."""
 
-    def test_login_missing_fields(self) -> None:
+    def test_login_missing_fields(self, client: TestClient) -> None:
         """POST /api/v1/auth/login with missing fields should return 422."""
         response = client.post("/api/v1/auth/login", json={})
         assert response.status_code == 422
 
-    def test_signup_missing_fields(self) -> None:
+    def test_signup_missing_fields(self, client: TestClient) -> None:
         """POST /api/v1/auth/signup with missing fields should return 422."""
         response = client.post("/api/v1/auth/signup", json={})
         assert response.status_code == 422
 
-    def test_signup_short_password(self) -> None:
+    def test_signup_short_password(self, client: TestClient) -> None:
         """POST /api/v1/auth/signup with a short password should return 422."""
         response = client.post(
             "/api/v1/auth/signup",
@@ -165,12 +216,12 @@ class TestAuthAPI:
         )
         assert response.status_code == 422
 
-    def test_get_me_unauthenticated(self) -> None:
+    def test_get_me_unauthenticated(self, client: TestClient) -> None:
         """GET /api/v1/auth/me without auth should return 401."""
         response = client.get("/api/v1/auth/me")
         assert response.status_code == 401
 
-    def test_logout_unauthenticated(self) -> None:
+    def test_logout_unauthenticated(self, client: TestClient) -> None:
         """POST /api/v1/auth/logout without auth should return 401."""
         response = client.post("/api/v1/auth/logout")
         assert response.status_code == 401
@@ -179,7 +230,7 @@ class TestAuthAPI:
 class TestAnalyticsAPI:
     """Tests for the /api/v1/analytics endpoints."""
 
-    def test_analytics_overview_returns_200(self) -> None:
+    def test_analytics_overview_returns_200(self, client: TestClient) -> None:
         """GET /api/v1/analytics/overview should return 200."""
         response = client.get("/api/v1/analytics/overview")
         assert response.status_code == 200
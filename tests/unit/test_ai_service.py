@@ -1,36 +1,39 @@
-"""Unit tests for AIService with mocked httpx and settings."""
+"""Unit tests for AIService with stubbed HTTP client and settings."""
 
 from __future__ import annotations
 
 import json
-from typing import Any, Dict
-from unittest.mock import AsyncMock, MagicMock, patch
+from collections.abc import Callable, Iterator
+from types import SimpleNamespace
+from typing import Any
 
 import httpx
 import pytest
 
+from app.core.config import Settings
 from app.core.exceptions import AIServiceException
 from app.dto.summary import SummaryCreate
+from app.services import ai_service
 from app.services.ai_service import AIService
 
-
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _ai_response_payload() -> Dict[str, Any]:
-    """Return a well-formed AI JSON payload."""
-    return {
-        "summary": "An excellent product with minor flaws.",
-        "sentiment": "positive",
-        "sentiment_score": 0.85,
-        "keywords": ["quality", "value", "design"],
-        "pros": ["Great build quality", "Good price"],
-        "cons": ["Slightly heavy"],
-    }
+# Well-formed AI JSON payload and its serialized form, built once. Tests
+# that need a variant copy it with ``dict(_AI_RESPONSE_PAYLOAD, ...)``.
+_AI_RESPONSE_PAYLOAD: dict[str, Any] = {
+    "summary": "An excellent product with minor flaws.",
+    "sentiment": "positive",
+    "sentiment_score": 0.85,
+    "keywords": ["quality", "value", "design"],
+    "pros": ["Great build quality", "Good price"],
+    "cons": ["Slightly heavy"],
+}
+_AI_RESPONSE_JSON = json.dumps(_AI_RESPONSE_PAYLOAD)
 
 
-def _openai_chat_response(payload: Dict[str, Any]) -> Dict[str, Any]:
+def _openai_chat_response(payload: dict[str, Any]) -> dict[str, Any]:
     """Wrap *payload* in an OpenAI Chat Completions response structure."""
     return {
         "choices": [
@@ -43,7 +46,7 @@ def _openai_chat_response(payload: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def _gemini_generate_response(payload: Dict[str, Any]) -> Dict[str, Any]:
+def _gemini_generate_response(payload: dict[str, Any]) -> dict[str, Any]:
     """Wrap *payload* in a Gemini generateContent response structure."""
     return {
         "candidates": [
@@ -58,192 +61,220 @@ def _gemini_generate_response(payload: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def _mock_httpx_response(
-    status_code: int = 200,
-    json_data: Any = None,
-) -> MagicMock:
-    """Create a mock ``httpx.Response``."""
-    resp = MagicMock(spec=httpx.Response)
-    resp.status_code = status_code
-    resp.json.return_value = json_data or {}
-    if status_code >= 400:
-        resp.raise_for_status.side_effect = httpx.HTTPStatusError(
-            message="error",
-            request=MagicMock(spec=httpx.Request),
-            response=resp,
-        )
-    else:
-        resp.raise_for_status.return_value = None
-    return resp
+@pytest.fixture(autouse=True)
+def _reset_http_client() -> Iterator[None]:
+    """Ensure the module-level shared HTTP client never leaks between tests."""
+    ai_service._http_client = None
+    yield
+    ai_service._http_client = None
+
+
+class _StubResponse:
+    """Minimal stand-in for ``httpx.Response`` as used by AIService.
+
+    When *text* is given, ``json`` decodes it with the stdlib like httpx
+    does, so a non-JSON body raises ``json.JSONDecodeError``.
+    """
+
+    def __init__(
+        self,
+        status_code: int = 200,
+        json_data: Any = None,
+        text: str | None = None,
+    ) -> None:
+        self.status_code = status_code
+        self._json_data = json_data or {}
+        self._text = text
+
+    def json(self) -> Any:
+        if self._text is not None:
+            return json.loads(self._text)
+        return self._json_data
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise httpx.HTTPStatusError(
+                message="error",
+                request=httpx.Request("POST", "https://ai.test"),
+                response=self,  # type: ignore[arg-type]
+            )
+
+
+class _StubHttpClient:
+    """Minimal stand-in for the shared ``httpx.AsyncClient``.
+
+    ``post`` records each call and returns :attr:`response`.
+    """
+
+    def __init__(self) -> None:
+        self.response = _StubResponse()
+        self.calls: list[tuple[Any, ...]] = []
+
+    async def post(self, *args: Any, **kwargs: Any) -> _StubResponse:
+        self.calls.append(args)
+        return self.response
+
+
+@pytest.fixture
+def ai_env(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Patch AIService settings and the shared HTTP client.
+
+    ``settings`` is a real ``Settings`` instance (ignoring ``.env``) with
+    both API keys empty; tests set the key they need and the
+    ``http_client.response`` to return directly. ``app_env`` is pinned
+    because process variables such as CI's ``APP_ENV`` still apply.
+    """
+    settings = Settings(
+        _env_file=None,
+        app_env="development",
+        openai_api_key="",
+        gemini_api_key="",
+    )
+    http_client = _StubHttpClient()
+    monkeypatch.setattr(ai_service, "get_settings", lambda: settings)
+    monkeypatch.setattr(ai_service, "_get_http_client", lambda: http_client)
+    return SimpleNamespace(settings=settings, http_client=http_client)
 
 
 # ---------------------------------------------------------------------------
-# Tests - OpenAI
+# Tests - Provider success
 # ---------------------------------------------------------------------------
 
-class TestGenerateSummaryOpenAI:
-    """Tests for AIService._generate_with_openai (via generate_summary)."""
 
-    @pytest.mark.asyncio
-    async def test_generate_summary_openai_success(self) -> None:
+class TestGenerateSummarySuccess:
+    """Tests for a successful generate_summary call with each provider.
+
+    Gemini is only used when no OpenAI key is configured.
+    """
+
+    @pytest.mark.parametrize(
+        ("key_name", "wrapper", "model"),
+        [
+            ("openai_api_key", _openai_chat_response, "gpt-4o-mini"),
+            ("gemini_api_key", _gemini_generate_response, "gemini-2.0-flash"),
+        ],
+    )
+    async def test_generate_summary_success(
+        self,
+        ai_env: SimpleNamespace,
+        key_name: str,
+        wrapper: Callable[[dict[str, Any]], dict[str, Any]],
+        model: str,
+    ) -> None:
         """generate_summary should return a SummaryCreate on success."""
-        payload = _ai_response_payload()
-        mock_response = _mock_httpx_response(
-            json_data=_openai_chat_response(payload),
+        setattr(ai_env.settings, key_name, "test-key")
+        ai_env.http_client.response = _StubResponse(
+            json_data=wrapper(_AI_RESPONSE_PAYLOAD),
         )
 
-        mock_client = AsyncMock(spec=httpx.AsyncClient)
-        mock_client.post.return_value = mock_response
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
-
-        with patch("app.services.ai_service.get_settings") as mock_settings, \
-             patch("app.services.ai_service.httpx.AsyncClient", return_value=mock_client):
-            settings = MagicMock()
-            settings.openai_api_key = "sk-test-key"
-            settings.gemini_api_key = ""
-            mock_settings.return_value = settings
-
-            service = AIService()
-            result = await service.generate_summary(
-                content="This product is amazing!",
-                title="Great Product",
-            )
+        result = await AIService().generate_summary(
+            content="This product is amazing!",
+            title="Great Product",
+        )
 
         assert isinstance(result, SummaryCreate)
         assert result.summary == "An excellent product with minor flaws."
         assert result.sentiment == "positive"
         assert result.sentiment_score == 0.85
-        assert result.ai_model == "gpt-4o-mini"
+        assert result.ai_model == model
         assert "quality" in result.keywords
 
-    @pytest.mark.asyncio
-    async def test_generate_summary_openai_api_error(self) -> None:
-        """generate_summary should raise AIServiceException on HTTP errors."""
-        mock_response = _mock_httpx_response(status_code=500)
 
-        mock_client = AsyncMock(spec=httpx.AsyncClient)
-        mock_client.post.return_value = mock_response
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
+# ---------------------------------------------------------------------------
+# Tests - Provider errors
+# ---------------------------------------------------------------------------
 
-        with patch("app.services.ai_service.get_settings") as mock_settings, \
-             patch("app.services.ai_service.httpx.AsyncClient", return_value=mock_client):
-            settings = MagicMock()
-            settings.openai_api_key = "sk-test-key"
-            settings.gemini_api_key = ""
-            mock_settings.return_value = settings
 
-            service = AIService()
+class TestGenerateSummaryOpenAI:
+    """Tests for AIService._generate_with_openai (via generate_summary)."""
 
-            with pytest.raises(AIServiceException) as exc_info:
-                await service.generate_summary(
-                    content="Some review",
-                    title="Title",
-                )
+    async def test_generate_summary_openai_api_error(self, ai_env: SimpleNamespace) -> None:
+        """generate_summary should raise AIServiceException on HTTP errors."""
+        ai_env.settings.openai_api_key = "sk-test-key"
+        ai_env.http_client.response = _StubResponse(status_code=500)
 
-            assert "OpenAI API error" in str(exc_info.value)
+        with pytest.raises(AIServiceException) as exc_info:
+            await AIService().generate_summary(
+                content="Some review",
+                title="Title",
+            )
 
+        assert "OpenAI API error" in str(exc_info.value)
 
-# ---------------------------------------------------------------------------
-# Tests - Gemini
-# ---------------------------------------------------------------------------
 
-class TestGenerateSummaryGemini:
-    """Tests for AIService._generate_with_gemini (via generate_summary)."""
+class TestGenerateSummaryParseFailure:
+    """Tests for provider responses whose body cannot be parsed."""
 
-    @pytest.mark.asyncio
-    async def test_generate_summary_gemini_success(self) -> None:
-        """generate_summary should fall back to Gemini when no OpenAI key."""
-        payload = _ai_response_payload()
-        mock_response = _mock_httpx_response(
-            json_data=_gemini_generate_response(payload),
-        )
+    @pytest.mark.parametrize("key_name", ["openai_api_key", "gemini_api_key"])
+    async def test_non_json_body_raises_ai_exception(
+        self,
+        ai_env: SimpleNamespace,
+        key_name: str,
+    ) -> None:
+        """A 200 response with a non-JSON body should raise AIServiceException."""
+        setattr(ai_env.settings, key_name, "test-key")
+        ai_env.http_client.response = _StubResponse(text="<html>Bad Gateway</html>")
 
-        mock_client = AsyncMock(spec=httpx.AsyncClient)
-        mock_client.post.return_value = mock_response
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
-
-        with patch("app.services.ai_service.get_settings") as mock_settings, \
-             patch("app.services.ai_service.httpx.AsyncClient", return_value=mock_client):
-            settings = MagicMock()
-            settings.openai_api_key = ""
-            settings.gemini_api_key = "gemini-test-key"
-            mock_settings.return_value = settings
-
-            service = AIService()
-            result = await service.generate_summary(
-                content="A wonderful restaurant experience.",
-                title="Best Restaurant",
-            )
+        with pytest.raises(AIServiceException) as exc_info:
+            await AIService().generate_summary(content="Some review", title="Title")
 
-        assert isinstance(result, SummaryCreate)
-        assert result.sentiment == "positive"
-        assert result.ai_model == "gemini-2.0-flash"
+        assert "Failed to parse AI response" in str(exc_info.value)
 
 
 # ---------------------------------------------------------------------------
 # Tests - No API key
 # ---------------------------------------------------------------------------
 
+
 class TestGenerateSummaryNoKey:
     """Tests for AIService when no API key is configured."""
 
-    @pytest.mark.asyncio
-    async def test_generate_summary_no_api_key(self) -> None:
+    async def test_generate_summary_no_api_key(self, ai_env: SimpleNamespace) -> None:
         """generate_summary should raise AIServiceException with no keys."""
-        with patch("app.services.ai_service.get_settings") as mock_settings:
-            settings = MagicMock()
-            settings.openai_api_key = ""
-            settings.gemini_api_key = ""
-            mock_settings.return_value = settings
-
-            service = AIService()
-
-            with pytest.raises(AIServiceException) as exc_info:
-                await service.generate_summary(
-                    content="Some content",
-                    title="Title",
-                )
+        with pytest.raises(AIServiceException) as exc_info:
+            await AIService().generate_summary(
+                content="Some content",
+                title="Title",
+            )
 
-            assert "No AI API key configured" in str(exc_info.value)
+        assert "No AI API key configured" in str(exc_info.value)
+        assert ai_env.http_client.calls == []
 
 
 # ---------------------------------------------------------------------------
 # Tests - JSON parsing
 # ---------------------------------------------------------------------------
 
+
 class TestParseAIResponse:
     """Tests for AIService._parse_ai_response."""
 
     def test_parse_valid_json(self) -> None:
         """_parse_ai_response should correctly parse well-formed JSON."""
-        payload = _ai_response_payload()
-        result = AIService._parse_ai_response(json.dumps(payload))
+        payload = _AI_RESPONSE_PAYLOAD
+        result = AIService._parse_ai_response(_AI_RESPONSE_JSON)
 
         assert result["summary"] == payload["summary"]
         assert result["sentiment"] == "positive"
         assert result["sentiment_score"] == 0.85
         assert result["keywords"] == payload["keywords"]
 
-    def test_parse_clamps_score(self) -> None:
+    @pytest.mark.parametrize(("raw", "expected"), [(5.0, 1.0), (-3.0, -1.0), (0.5, 0.5)])
+    def test_parse_clamps_score(self, raw: float, expected: float) -> None:
         """_parse_ai_response should clamp sentiment_score to [-1.0, 1.0]."""
-        payload = _ai_response_payload()
-        payload["sentiment_score"] = 5.0
+        payload = dict(_AI_RESPONSE_PAYLOAD, sentiment_score=raw)
         result = AIService._parse_ai_response(json.dumps(payload))
-        assert result["sentiment_score"] == 1.0
+        assert result["sentiment_score"] == expected
 
-        payload["sentiment_score"] = -3.0
-        result = AIService._parse_ai_response(json.dumps(payload))
-        assert result["sentiment_score"] == -1.0
-
-    def test_parse_normalises_invalid_sentiment(self) -> None:
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [("happy", "neutral"), ("positive", "positive"), ("mixed", "mixed")],
+    )
+    def test_parse_normalises_sentiment(self, raw: str, expected: str) -> None:
         """_parse_ai_response should default to 'neutral' for unknown sentiments."""
-        payload = _ai_response_payload()
-        payload["sentiment"] = "happy"
+        payload = dict(_AI_RESPONSE_PAYLOAD, sentiment=raw)
         result = AIService._parse_ai_response(json.dumps(payload))
-        assert result["sentiment"] == "neutral"
+        assert result["sentiment"] == expected
 
     def test_parse_invalid_json_raises(self) -> None:
         """_parse_ai_response should raise on invalid JSON."""
@@ -259,3 +290,23 @@ class TestParseAIResponse:
         assert result["keywords"] == []
         assert result["pros"] == []
         assert result["cons"] == []
+
+
+# ---------------------------------------------------------------------------
+# Tests - Shared HTTP client
+# ---------------------------------------------------------------------------
+
+
+class TestSharedHttpClient:
+    """Tests for the module-level HTTP client lifecycle."""
+
+    async def test_client_is_reused_until_closed(self) -> None:
+        """_get_http_client should reuse one client until it is closed."""
+        first = ai_service._get_http_client()
+        assert ai_service._get_http_client() is first
+
+        await ai_service.close_http_client()
+
+        assert first.is_closed
+        assert ai_service._get_http_client() is not first
+        await ai_service.close_http_client()
@@ -0,0 +1,76 @@
+"""Unit tests for AnalyticsService with a mocked Supabase client."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import ValidationError
+
+from app.dto.analytics import AnalyticsResponse
+from app.services.analytics_service import AnalyticsService
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+# Payload as returned by the ``analytics_overview`` RPC.
+_OVERVIEW: dict[str, Any] = {
+    "total_reviews": 4,
+    "avg_rating": 3.67,
+    "category_stats": [
+        {"category": "book", "count": 2, "avg_rating": 4.5},
+        {"category": "product", "count": 2, "avg_rating": 2.0},
+    ],
+    "sentiment_stats": {
+        "positive": 2,
+        "negative": 1,
+        "neutral": 0,
+        "mixed": 0,
+        "total": 3,
+    },
+}
+
+
+@pytest.fixture
+def mock_client() -> MagicMock:
+    """Return a Supabase client mock serving the overview RPC."""
+    client = MagicMock()
+    client.rpc.return_value.execute.return_value = MagicMock(data=_OVERVIEW)
+    return client
+
+
+# ---------------------------------------------------------------------------
+# get_overview
+# ---------------------------------------------------------------------------
+
+
+class TestGetOverview:
+    """Tests for AnalyticsService.get_overview."""
+
+    def test_get_overview_single_round_trip(self, mock_client: MagicMock) -> None:
+        """get_overview should fetch everything with one RPC call."""
+        result = AnalyticsService(mock_client).get_overview()
+
+        mock_client.rpc.assert_called_once_with("analytics_overview")
+        mock_client.table.assert_not_called()
+        assert isinstance(result, AnalyticsResponse)
+        assert result.total_reviews == 4
+        assert result.avg_rating == 3.67
+
+    def test_get_overview_unpacks_nested_stats(self, mock_client: MagicMock) -> None:
+        """Sentiment and category stats should be parsed into DTOs."""
+        result = AnalyticsService(mock_client).get_overview()
+
+        assert result.sentiment_stats.positive == 2
+        assert result.sentiment_stats.total == 3
+        assert [s.category for s in result.category_stats] == ["book", "product"]
+        assert result.category_stats[0].avg_rating == 4.5
+
+    def test_get_overview_rejects_malformed_payload(self, mock_client: MagicMock) -> None:
+        """A payload missing required fields should fail validation."""
+        mock_client.rpc.return_value.execute.return_value = MagicMock(data={})
+
+        with pytest.raises(ValidationError):
+            AnalyticsService(mock_client).get_overview()
@@ -0,0 +1,60 @@
+"""Unit tests for the in-process TTL cache."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from app.core.cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_get_returns_stored_value(self) -> None:
+        """get should return a value stored with set."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+    def test_get_missing_returns_none(self) -> None:
+        """get should return None for unknown keys."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60)
+        assert cache.get("missing") is None
+
+    def test_entry_expires_after_ttl(self) -> None:
+        """Entries should no longer be returned once their TTL elapses."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=30)
+        with patch("app.core.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("app.core.cache.time.monotonic", return_value=129.0):
+            assert cache.get("a") == 1
+        with patch("app.core.cache.time.monotonic", return_value=131.0):
+            assert cache.get("a") is None
+
+    def test_per_entry_ttl_overrides_default(self) -> None:
+        """A TTL passed to set should override the cache default."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60)
+        with patch("app.core.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1, ttl=5)
+        with patch("app.core.cache.time.monotonic", return_value=106.0):
+            assert cache.get("a") is None
+
+    def test_oldest_entry_evicted_when_full(self) -> None:
+        """The oldest entry should be evicted once maxsize is reached."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_pop_and_clear(self) -> None:
+        """pop should remove one entry and clear should remove all."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.pop("a")
+        assert cache.get("a") is None
+        cache.clear()
+        assert cache.get("b") is None
@@ -0,0 +1,143 @@
+"""Unit tests for API dependencies with mocked Supabase client."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from jose import jwt
+from starlette.requests import Request
+
+from app.api import deps
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _request_with_token(token: str) -> Request:
+    """Build a minimal request carrying a bearer token."""
+    return Request(
+        {
+            "type": "http",
+            "headers": [(b"authorization", f"Bearer {token}".encode())],
+        }
+    )
+
+
+def _make_token(expires_in: int = 3600) -> str:
+    """Return a syntactically valid JWT."""
+    return jwt.encode({"sub": "user", "exp": int(time.time()) + expires_in}, "secret")
+
+
+def _mock_supabase_user() -> MagicMock:
+    """Return a mock Supabase client whose auth.get_user succeeds."""
+    supabase = MagicMock()
+    user = supabase.auth.get_user.return_value.user
+    user.id = "11111111-1111-1111-1111-111111111111"
+    user.email = "user@example.com"
+    user.created_at = None
+    return supabase
+
+
+@pytest.fixture(autouse=True)
+def _clear_token_cache() -> Iterator[None]:
+    """Ensure cached tokens never leak between tests."""
+    deps._token_cache.clear()
+    yield
+    deps._token_cache.clear()
+
+
+# ---------------------------------------------------------------------------
+# Tests - get_current_user
+# ---------------------------------------------------------------------------
+
+
+class TestGetCurrentUser:
+    """Tests for get_current_user."""
+
+    async def test_malformed_token_rejected_locally(self) -> None:
+        """Tokens that are not JWT-shaped should never reach Supabase."""
+        with (
+            patch("app.api.deps.get_supabase_client") as mock_client,
+            pytest.raises(HTTPException) as exc_info,
+        ):
+            await deps.get_current_user(_request_with_token("not-a-jwt"))
+
+        assert exc_info.value.status_code == 401
+        mock_client.assert_not_called()
+
+    async def test_valid_token_is_cached(self) -> None:
+        """A validated token should be served from cache on the next request."""
+        supabase = _mock_supabase_user()
+        token = _make_token()
+
+        with patch("app.api.deps.get_supabase_client", return_value=supabase):
+            first = await deps.get_current_user(_request_with_token(token))
+            second = await deps.get_current_user(_request_with_token(token))
+
+        assert first == second
+        assert first["email"] == "user@example.com"
+        supabase.auth.get_user.assert_called_once_with(token)
+
+    async def test_cached_user_cannot_be_mutated(self) -> None:
+        """Mutating a returned user should not change later cache hits."""
+        supabase = _mock_supabase_user()
+        token = _make_token()
+
+        with patch("app.api.deps.get_supabase_client", return_value=supabase):
+            first = await deps.get_current_user(_request_with_token(token))
+            first["email"] = "changed@example.com"
+            second = await deps.get_current_user(_request_with_token(token))
+            second["id"] = "changed"
+            third = await deps.get_current_user(_request_with_token(token))
+
+        assert third["email"] == "user@example.com"
+        assert third["id"] != "changed"
+        supabase.auth.get_user.assert_called_once_with(token)
+
+    async def test_invalidated_token_is_revalidated(self) -> None:
+        """invalidate_cached_token should force a fresh Supabase lookup."""
+        supabase = _mock_supabase_user()
+        token = _make_token()
+
+        with patch("app.api.deps.get_supabase_client", return_value=supabase):
+            await deps.get_current_user(_request_with_token(token))
+            deps.invalidate_cached_token(token)
+            await deps.get_current_user(_request_with_token(token))
+
+        assert supabase.auth.get_user.call_count == 2
+
+    async def test_expired_token_not_cached(self) -> None:
+        """Tokens past their exp claim should not be cached."""
+        supabase = _mock_supabase_user()
+        token = _make_token(expires_in=-10)
+
+        with patch("app.api.deps.get_supabase_client", return_value=supabase):
+            await deps.get_current_user(_request_with_token(token))
+            await deps.get_current_user(_request_with_token(token))
+
+        assert supabase.auth.get_user.call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# Tests - per-request user client
+# ---------------------------------------------------------------------------
+
+
+class TestCreateUserClient:
+    """Tests for create_user_client."""
+
+    def test_client_sends_user_token(self) -> None:
+        """The client should authenticate as the user, not with the anon key."""
+        token = _make_token()
+        settings = MagicMock(supabase_url="https://test.supabase.co", supabase_anon_key=token)
+
+        with patch("app.api.deps.get_settings", return_value=settings):
+            client = deps.create_user_client("user.jwt.token")
+
+        assert client.options.headers["Authorization"] == "Bearer user.jwt.token"
+        assert client.options.headers["apiKey"] == token
@@ -1,34 +1,96 @@
 """Unit tests for DTO validation."""
 
 from datetime import datetime
+from typing import Any
 from uuid import uuid4
 
 import pytest
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from app.dto.analytics import AnalyticsResponse, CategoryStats, SentimentStats
 from app.dto.review import ReviewCreate, ReviewListResponse, ReviewResponse
 from app.dto.summary import SummaryCreate
 from app.dto.user import UserCreate
 
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+# Fully populated valid payloads. Negative-path tests override one field.
+_VALID_REVIEW: dict[str, Any] = {
+    "title": "Great Product",
+    "content": "This product exceeded my expectations.",
+    "category": "product",
+    "rating": 5,
+    "source": "https://example.com/review/1",
+}
+_VALID_SUMMARY: dict[str, Any] = {
+    "summary": "This is a well-crafted product with minor flaws.",
+    "sentiment": "positive",
+    "sentiment_score": 0.85,
+    "keywords": ["quality", "durable", "affordable"],
+    "pros": ["Good build quality", "Affordable price"],
+    "cons": ["Limited color options"],
+    "ai_model": "gpt-4",
+}
+_VALID_USER: dict[str, Any] = {
+    "email": "user@example.com",
+    "password": "securepassword123",
+}
+
+
+def _error_locs(
+    model_cls: type[BaseModel],
+    data: dict[str, Any],
+) -> set[tuple[int | str, ...]]:
+    """Validate *data* and return the locations of its errors.
+
+    Returns an empty set if the data is valid. Errors are rendered without
+    documentation URLs, context or input, which the assertions never inspect.
+    """
+    try:
+        model_cls.model_validate(data)
+    except ValidationError as exc:
+        return {
+            e["loc"]
+            for e in exc.errors(include_url=False, include_context=False, include_input=False)
+        }
+    return set()
+
+
+@pytest.fixture(scope="module")
+def valid_review() -> ReviewCreate:
+    """ReviewCreate validated once per module from ``_VALID_REVIEW``."""
+    return ReviewCreate(**_VALID_REVIEW)
+
+
+@pytest.fixture(scope="module")
+def valid_summary() -> SummaryCreate:
+    """SummaryCreate validated once per module from ``_VALID_SUMMARY``."""
+    return SummaryCreate(**_VALID_SUMMARY)
+
+
+@pytest.fixture(scope="module")
+def valid_user() -> UserCreate:
+    """UserCreate validated once per module from ``_VALID_USER``."""
+    return UserCreate(**_VALID_USER)
+
+
+# ---------------------------------------------------------------------------
+# Tests - request DTOs
+# ---------------------------------------------------------------------------
+
 
 class TestReviewCreate:
     """Tests for ReviewCreate DTO validation."""
 
-    def test_valid_review_create(self) -> None:
+    def test_valid_review_create(self, valid_review: ReviewCreate) -> None:
         """ReviewCreate accepts valid data with all fields."""
-        review = ReviewCreate(
-            title="Great Product",
-            content="This product exceeded my expectations.",
-            category="product",
-            rating=5,
-            source="https://example.com/review/1",
-        )
-        assert review.title == "Great Product"
-        assert review.content == "This product exceeded my expectations."
-        assert review.category == "product"
-        assert review.rating == 5
-        assert review.source == "https://example.com/review/1"
+        assert valid_review.title == "Great Product"
+        assert valid_review.content == "This product exceeded my expectations."
+        assert valid_review.category == "product"
+        assert valid_review.rating == 5
+        assert valid_review.source == "https://example.com/review/1"
 
     def test_valid_review_create_minimal(self) -> None:
         """ReviewCreate accepts valid data with only required fields."""
@@ -42,74 +104,33 @@ class TestReviewCreate:
         assert review.rating is None
         assert review.source is None
 
-    def test_invalid_category(self) -> None:
-        """ReviewCreate rejects invalid category values."""
-        with pytest.raises(ValidationError) as exc_info:
-            ReviewCreate(
-                title="Test",
-                content="Test content",
-                category="invalid_category",
-            )
-        errors = exc_info.value.errors()
-        assert any(e["loc"] == ("category",) for e in errors)
-
-    def test_title_too_long(self) -> None:
-        """ReviewCreate rejects titles exceeding 200 characters."""
-        with pytest.raises(ValidationError) as exc_info:
-            ReviewCreate(
-                title="A" * 201,
-                content="Test content",
-                category="product",
-            )
-        errors = exc_info.value.errors()
-        assert any(e["loc"] == ("title",) for e in errors)
-
-    def test_rating_out_of_range_low(self) -> None:
-        """ReviewCreate rejects ratings below 1."""
-        with pytest.raises(ValidationError) as exc_info:
-            ReviewCreate(
-                title="Test",
-                content="Test content",
-                category="product",
-                rating=0,
-            )
-        errors = exc_info.value.errors()
-        assert any(e["loc"] == ("rating",) for e in errors)
-
-    def test_rating_out_of_range_high(self) -> None:
-        """ReviewCreate rejects ratings above 5."""
-        with pytest.raises(ValidationError) as exc_info:
-            ReviewCreate(
-                title="Test",
-                content="Test content",
-                category="product",
-                rating=6,
-            )
-        errors = exc_info.value.errors()
-        assert any(e["loc"] == ("rating",) for e in errors)
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [
+            ("category", "invalid_category"),
+            ("title", "A" * 201),
+            ("rating", 0),
+            ("rating", 6),
+        ],
+        ids=["invalid-category", "title-too-long", "rating-too-low", "rating-too-high"],
+    )
+    def test_rejects_invalid_field(self, field: str, value: Any) -> None:
+        """ReviewCreate rejects bad categories, over-long titles and ratings outside 1-5."""
+        assert (field,) in _error_locs(ReviewCreate, {**_VALID_REVIEW, field: value})
 
 
 class TestSummaryCreate:
     """Tests for SummaryCreate DTO validation."""
 
-    def test_valid_summary_create(self) -> None:
+    def test_valid_summary_create(self, valid_summary: SummaryCreate) -> None:
         """SummaryCreate accepts valid data with all fields."""
-        summary = SummaryCreate(
-            summary="This is a well-crafted product with minor flaws.",
-            sentiment="positive",
-            sentiment_score=0.85,
-            keywords=["quality", "durable", "affordable"],
-            pros=["Good build quality", "Affordable price"],
-            cons=["Limited color options"],
-            ai_model="gpt-4",
-        )
-        assert summary.summary == "This is a well-crafted product with minor flaws."
-        assert summary.sentiment == "positive"
-        assert summary.sentiment_score == 0.85
-        assert summary.keywords == ["quality", "durable", "affordable"]
-        assert summary.pros == ["Good build quality", "Affordable price"]
-        assert summary.cons == ["Limited color options"]
-        assert summary.ai_model == "gpt-4"
+        assert valid_summary.summary == "This is a well-crafted product with minor flaws."
+        assert valid_summary.sentiment == "positive"
+        assert valid_summary.sentiment_score == 0.85
+        assert valid_summary.keywords == ["quality", "durable", "affordable"]
+        assert valid_summary.pros == ["Good build quality", "Affordable price"]
+        assert valid_summary.cons == ["Limited color options"]
+        assert valid_summary.ai_model == "gpt-4"
 
     def test_valid_summary_create_minimal(self) -> None:
         """SummaryCreate accepts valid data with only required fields."""
@@ -123,71 +144,41 @@ class TestSummaryCreate:
         assert summary.cons == []
         assert summary.ai_model is None
 
-    def test_sentiment_score_too_low(self) -> None:
-        """SummaryCreate rejects sentiment_score below -1.0."""
-        with pytest.raises(ValidationError) as exc_info:
-            SummaryCreate(
-                summary="Bad product.",
-                sentiment="negative",
-                sentiment_score=-1.5,
-            )
-        errors = exc_info.value.errors()
-        assert any(e["loc"] == ("sentiment_score",) for e in errors)
-
-    def test_sentiment_score_too_high(self) -> None:
-        """SummaryCreate rejects sentiment_score above 1.0."""
-        with pytest.raises(ValidationError) as exc_info:
-            SummaryCreate(
-                summary="Great product.",
-                sentiment="positive",
-                sentiment_score=1.5,
-            )
-        errors = exc_info.value.errors()
-        assert any(e["loc"] == ("sentiment_score",) for e in errors)
-
-    def test_invalid_sentiment_value(self) -> None:
-        """SummaryCreate rejects invalid sentiment literals."""
-        with pytest.raises(ValidationError) as exc_info:
-            SummaryCreate(
-                summary="Some review.",
-                sentiment="very_positive",
-                sentiment_score=0.5,
-            )
-        errors = exc_info.value.errors()
-        assert any(e["loc"] == ("sentiment",) for e in errors)
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [
+            ("sentiment_score", -1.5),
+            ("sentiment_score", 1.5),
+            ("sentiment", "very_positive"),
+        ],
+        ids=["score-too-low", "score-too-high", "invalid-sentiment"],
+    )
+    def test_rejects_invalid_field(self, field: str, value: Any) -> None:
+        """SummaryCreate rejects scores outside [-1.0, 1.0] and unknown sentiments."""
+        assert (field,) in _error_locs(SummaryCreate, {**_VALID_SUMMARY, field: value})
 
 
 class TestUserCreate:
     """Tests for UserCreate DTO validation."""
 
-    def test_valid_user_create(self) -> None:
+    def test_valid_user_create(self, valid_user: UserCreate) -> None:
         """UserCreate accepts valid email and password."""
-        user = UserCreate(
-            email="user@example.com",
-            password="securepassword123",
-        )
-        assert user.email == "user@example.com"
-        assert user.password == "securepassword123"
-
-    def test_short_password(self) -> None:
-        """UserCreate rejects passwords shorter than 8 characters."""
-        with pytest.raises(ValidationError) as exc_info:
-            UserCreate(
-                email="user@example.com",
-                password="short",
-            )
-        errors = exc_info.value.errors()
-        assert any(e["loc"] == ("password",) for e in errors)
-
-    def test_invalid_email(self) -> None:
-        """UserCreate rejects invalid email addresses."""
-        with pytest.raises(ValidationError) as exc_info:
-            UserCreate(
-                email="not-an-email",
-                password="securepassword123",
-            )
-        errors = exc_info.value.errors()
-        assert any(e["loc"] == ("email",) for e in errors)
+        assert valid_user.email == "user@example.com"
+        assert valid_user.password == _VALID_USER["password"]
+
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [("password", "short"), ("email", "not-an-email")],
+        ids=["short-password", "invalid-email"],
+    )
+    def test_rejects_invalid_field(self, field: str, value: Any) -> None:
+        """UserCreate rejects passwords under 8 characters and invalid emails."""
+        assert (field,) in _error_locs(UserCreate, {**_VALID_USER, field: value})
+
+
+# ---------------------------------------------------------------------------
+# Tests - response DTOs
+# ---------------------------------------------------------------------------
 
 
 class TestReviewListResponse:
@@ -198,7 +189,9 @@ class TestReviewListResponse:
         now = datetime.now()
         review_id = uuid4()
 
-        review_data = ReviewResponse(
+        # The item's own validation is covered elsewhere; only the list
+        # wrapper is under test here.
+        review_data = ReviewResponse.model_construct(
             id=review_id,
             title="Test Review",
             content="Test content here.",
@@ -224,6 +217,32 @@ class TestReviewListResponse:
         assert response.items[0].id == review_id
         assert response.items[0].title == "Test Review"
 
+    def test_review_list_response_validates_raw_items(self) -> None:
+        """ReviewListResponse coerces raw row dicts into ReviewResponse items."""
+        review_id = uuid4()
+        now = "2024-01-01T00:00:00+00:00"
+
+        response = ReviewListResponse.model_validate(
+            {
+                "items": [
+                    {
+                        "id": str(review_id),
+                        "title": "Test Review",
+                        "content": "Test content here.",
+                        "category": "movie",
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                ],
+                "total": 1,
+                "page": 1,
+                "per_page": 10,
+            }
+        )
+        assert isinstance(response.items[0], ReviewResponse)
+        assert response.items[0].id == review_id
+        assert response.items[0].created_at == datetime.fromisoformat(now)
+
     def test_empty_review_list_response(self) -> None:
         """ReviewListResponse accepts an empty items list."""
         response = ReviewListResponse(
@@ -265,9 +284,7 @@ class TestAnalyticsDTOs:
     def test_analytics_response_no_rating(self) -> None:
         """AnalyticsResponse accepts null avg_rating."""
         response = AnalyticsResponse(
-            sentiment_stats=SentimentStats(
-                positive=0, negative=0, neutral=0, mixed=0, total=0
-            ),
+            sentiment_stats=SentimentStats(positive=0, negative=0, neutral=0, mixed=0, total=0),
             category_stats=[],
             total_reviews=0,
             avg_rating=None,
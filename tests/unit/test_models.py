@@ -0,0 +1,115 @@
+"""Unit tests for domain model conversion."""
+
+from datetime import UTC, datetime
+from uuid import UUID
+
+import pytest
+from pydantic import ValidationError
+
+from app.models.review import Review
+from app.models.summary import Summary
+from app.models.user import User
+
+_ID = "11111111-1111-1111-1111-111111111111"
+
+
+class TestReviewModel:
+    """Tests for Review.from_dict / Review.to_dict."""
+
+    def test_from_dict_coerces_strings(self) -> None:
+        """from_dict parses UUID and ISO timestamp strings."""
+        review = Review.from_dict(
+            {
+                "id": _ID,
+                "title": "Title",
+                "content": "Content",
+                "category": "book",
+                "author_id": _ID,
+                "created_at": "2024-01-02T03:04:05.123456+00:00",
+            }
+        )
+        assert isinstance(review, Review)
+        assert review.id == UUID(_ID)
+        assert review.author_id == UUID(_ID)
+        assert review.summary_id is None
+        assert review.created_at == datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=UTC)
+
+    def test_from_dict_ignores_unknown_keys(self) -> None:
+        """from_dict ignores columns that are not model fields."""
+        review = Review.from_dict({"title": "T", "content": "C", "category": "book", "extra": 1})
+        assert review.title == "T"
+        assert isinstance(review.id, UUID)
+
+    def test_from_dict_missing_required_field(self) -> None:
+        """from_dict raises when a required field is missing."""
+        with pytest.raises(ValidationError):
+            Review.from_dict({"title": "T", "content": "C"})
+
+    def test_to_dict_serializes_to_strings(self) -> None:
+        """to_dict renders UUIDs and datetimes as strings."""
+        review = Review(
+            title="T",
+            content="C",
+            category="book",
+            id=UUID(_ID),
+            created_at=datetime(2024, 1, 2, 3, 4, 5),
+        )
+        data = review.to_dict()
+        assert data["id"] == _ID
+        assert data["author_id"] is None
+        assert data["created_at"] == "2024-01-02T03:04:05"
+
+    def test_to_dict_renders_utc_with_z_suffix(self) -> None:
+        """Aware UTC datetimes are rendered with a trailing 'Z', not '+00:00'."""
+        review = Review(
+            title="T",
+            content="C",
+            category="book",
+            created_at=datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=UTC),
+            updated_at=datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC),
+        )
+        data = review.to_dict()
+        assert data["created_at"] == "2024-01-02T03:04:05.123456Z"
+        assert data["updated_at"] == "2024-01-02T03:04:05Z"
+
+    def test_default_timestamps_are_utc(self) -> None:
+        """Default timestamps should be timezone-aware UTC."""
+        review = Review(title="T", content="C", category="book")
+        assert review.created_at.tzinfo is UTC
+        assert review.updated_at.tzinfo is UTC
+
+    def test_round_trip(self) -> None:
+        """to_dict output can be fed back into from_dict."""
+        review = Review(title="T", content="C", category="book", rating=4)
+        assert Review.from_dict(review.to_dict()) == review
+
+
+class TestSummaryModel:
+    """Tests for Summary.from_dict / Summary.to_dict."""
+
+    def test_from_dict_coerces_score(self) -> None:
+        """from_dict coerces numeric strings for sentiment_score."""
+        summary = Summary.from_dict(
+            {"summary": "S", "sentiment": "positive", "sentiment_score": "0.75"}
+        )
+        assert summary.sentiment_score == 0.75
+        assert summary.keywords == []
+
+    def test_round_trip(self) -> None:
+        """to_dict output can be fed back into from_dict."""
+        summary = Summary(summary="S", sentiment="mixed", sentiment_score=0.1, pros=["a"])
+        assert Summary.from_dict(summary.to_dict()) == summary
+
+
+class TestUserModel:
+    """Tests for User.from_dict / User.to_dict."""
+
+    def test_to_dict_renders_utc_with_z_suffix(self) -> None:
+        """Aware UTC datetimes are rendered with a trailing 'Z', not '+00:00'."""
+        user = User(email="user@example.com", created_at=datetime(2024, 1, 2, tzinfo=UTC))
+        assert user.to_dict()["created_at"] == "2024-01-02T00:00:00Z"
+
+    def test_round_trip(self) -> None:
+        """to_dict output can be fed back into from_dict."""
+        user = User(email="user@example.com")
+        assert User.from_dict(user.to_dict()) == user
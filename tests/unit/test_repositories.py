@@ -0,0 +1,235 @@
+"""Unit tests for repositories with a mocked Supabase client."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.repositories.review_repo import ReviewRepository, decode_cursor, encode_cursor
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _mock_client(rows: list[dict[str, Any]], count: int | None) -> MagicMock:
+    """Return a Supabase client mock whose query chain yields *rows*."""
+    client = MagicMock()
+    query = client.table.return_value
+    for method in ("select", "eq", "or_", "filter", "order", "range", "limit"):
+        getattr(query, method).return_value = query
+    query.execute.return_value = MagicMock(data=rows, count=count)
+    return client
+
+
+# ---------------------------------------------------------------------------
+# Tests - pagination counts
+# ---------------------------------------------------------------------------
+
+
+class TestPaginationCount:
+    """Tests for the count strategy on paginated queries."""
+
+    def test_get_all_defaults_to_planned_count(self) -> None:
+        """get_all should request a planner estimate rather than COUNT(*)."""
+        client = _mock_client([{"id": "1"}], count=42)
+
+        rows, total = ReviewRepository(client).get_all(page=1, per_page=20)
+
+        client.table.return_value.select.assert_called_once_with(
+            ReviewRepository.list_columns, count="planned"
+        )
+        assert rows == [{"id": "1"}]
+        assert total == 42
+
+    def test_get_all_exact_count_is_opt_in(self) -> None:
+        """Callers can still ask for an exact count."""
+        client = _mock_client([], count=0)
+
+        ReviewRepository(client).get_by_category("book", count="exact")
+
+        client.table.return_value.select.assert_called_once_with(
+            ReviewRepository.list_columns, count="exact"
+        )
+
+    def test_list_columns_exclude_search_index(self) -> None:
+        """List queries should not fetch the search_tsv index column."""
+        assert "search_tsv" not in ReviewRepository.list_columns
+
+    def test_columns_override(self) -> None:
+        """Callers can project a narrower column list."""
+        client = _mock_client([], count=0)
+
+        ReviewRepository(client).get_by_category("book", columns="id,title")
+
+        client.table.return_value.select.assert_called_once_with("id,title", count="planned")
+
+    @pytest.mark.parametrize(
+        ("rows", "expected_total"),
+        [
+            ([{"id": str(i)} for i in range(5)], 15),
+            ([{"id": "1"}, {"id": "2"}], 7),
+        ],
+    )
+    def test_no_count_estimates_total(
+        self,
+        rows: list[dict[str, Any]],
+        expected_total: int,
+    ) -> None:
+        """Without a count, a full page reports one more page of rows."""
+        client = _mock_client(rows, count=None)
+
+        _, total = ReviewRepository(client).search("great", page=2, per_page=5, count=None)
+
+        client.table.return_value.select.assert_called_once_with(
+            ReviewRepository.list_columns, count=None
+        )
+        assert total == expected_total
+
+
+# ---------------------------------------------------------------------------
+# Tests - search
+# ---------------------------------------------------------------------------
+
+
+class TestSearch:
+    """Tests for ReviewRepository.search."""
+
+    def test_search_uses_full_text_index(self) -> None:
+        """Queries of three or more characters should hit search_tsv."""
+        client = _mock_client([], count=0)
+
+        ReviewRepository(client).search("great phone")
+
+        query = client.table.return_value
+        query.filter.assert_called_once_with("search_tsv", "wfts(simple)", "great phone")
+        query.or_.assert_not_called()
+
+    def test_short_search_falls_back_to_ilike(self) -> None:
+        """Very short queries should keep substring matching."""
+        client = _mock_client([], count=0)
+
+        ReviewRepository(client).search("tv")
+
+        query = client.table.return_value
+        query.or_.assert_called_once_with("title.ilike.%tv%,content.ilike.%tv%")
+        query.filter.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Tests - iter_all
+# ---------------------------------------------------------------------------
+
+
+class TestIterAll:
+    """Tests for ReviewRepository.iter_all."""
+
+    def test_iter_all_seeks_batch_by_batch(self) -> None:
+        """iter_all should continue after each batch's last row until a short batch."""
+        rows = [
+            {
+                "id": f"{day}0000000-0000-0000-0000-000000000000",
+                "created_at": f"2024-01-0{day}T00:00:00+00:00",
+            }
+            for day in (3, 2, 1)
+        ]
+        client = _mock_client([], count=None)
+        query = client.table.return_value
+        query.execute.side_effect = [MagicMock(data=rows[:2]), MagicMock(data=rows[2:])]
+
+        result = list(ReviewRepository(client).iter_all(batch_size=2, category="book"))
+
+        assert result == rows
+        query.or_.assert_called_once_with(
+            'created_at.lt."2024-01-02T00:00:00+00:00",'
+            'and(created_at.eq."2024-01-02T00:00:00+00:00",'
+            "id.lt.20000000-0000-0000-0000-000000000000)"
+        )
+        assert [c.args for c in query.limit.call_args_list] == [(2,), (2,)]
+        query.range.assert_not_called()
+        query.eq.assert_called_with("category", "book")
+
+
+# ---------------------------------------------------------------------------
+# Tests - keyset pagination
+# ---------------------------------------------------------------------------
+
+
+class TestKeysetPagination:
+    """Tests for ReviewRepository.get_after and the cursor helpers."""
+
+    _ROW = {
+        "id": "11111111-1111-1111-1111-111111111111",
+        "created_at": "2024-01-02T03:04:05.123456+00:00",
+    }
+
+    def test_cursor_round_trip(self) -> None:
+        """decode_cursor should return the row's created_at and id."""
+        created_at, row_id = decode_cursor(encode_cursor(self._ROW))
+
+        assert created_at == self._ROW["created_at"]
+        assert row_id == self._ROW["id"]
+
+    @pytest.mark.parametrize(
+        "cursor",
+        ["not base64!", encode_cursor({"created_at": "x", "id": "y"})],
+    )
+    def test_malformed_cursor_rejected(self, cursor: str) -> None:
+        """Cursors that do not decode to a timestamp and UUID are rejected."""
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+    def test_get_after_seeks_past_cursor(self) -> None:
+        """get_after should filter on (created_at, id) instead of using OFFSET."""
+        client = _mock_client([], count=None)
+
+        ReviewRepository(client).get_after(encode_cursor(self._ROW), per_page=10)
+
+        query = client.table.return_value
+        query.or_.assert_called_once_with(
+            'created_at.lt."2024-01-02T03:04:05.123456+00:00",'
+            'and(created_at.eq."2024-01-02T03:04:05.123456+00:00",'
+            "id.lt.11111111-1111-1111-1111-111111111111)"
+        )
+        query.limit.assert_called_once_with(10)
+        query.range.assert_not_called()
+
+    def test_get_after_first_page_has_no_seek(self) -> None:
+        """Without a cursor, get_after should return the newest rows."""
+        client = _mock_client([self._ROW], count=None)
+
+        rows, _ = ReviewRepository(client).get_after(None, per_page=10)
+
+        assert rows == [self._ROW]
+        client.table.return_value.or_.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Tests - embedded summary
+# ---------------------------------------------------------------------------
+
+
+class TestGetWithSummary:
+    """Tests for ReviewRepository.get_with_summary."""
+
+    def test_embeds_summary_in_one_request(self) -> None:
+        """The linked summary should be fetched via a PostgREST embed."""
+        row = {"title": "T", "summary": {"summary": "S"}}
+        client = _mock_client([row], count=None)
+        review_id = uuid4()
+
+        result = ReviewRepository(client).get_with_summary(review_id, columns="title")
+
+        assert result == row
+        query = client.table.return_value
+        query.select.assert_called_once_with("title, summary:summaries(*)")
+        query.eq.assert_called_once_with("id", str(review_id))
+
+    def test_missing_review_returns_none(self) -> None:
+        """get_with_summary should return None when the review is absent."""
+        client = _mock_client([], count=None)
+
+        assert ReviewRepository(client).get_with_summary(uuid4()) is None
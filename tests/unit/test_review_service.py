@@ -2,72 +2,102 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any, Dict
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from typing import Any
 from unittest.mock import MagicMock
 from uuid import UUID, uuid4
 
 import pytest
 
-from app.core.exceptions import AuthorizationException, NotFoundException
+from app.core.exceptions import (
+    AuthorizationException,
+    NotFoundException,
+    ValidationException,
+)
 from app.dto.review import ReviewCreate, ReviewListResponse, ReviewResponse
-from app.repositories.review_repo import ReviewRepository
+from app.repositories.review_repo import ReviewRepository, encode_cursor
 from app.services.review_service import ReviewService
 
-
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
+# Rows come from TIMESTAMPTZ columns, so the frozen timestamp is UTC-aware.
+_FIXED_NOW = datetime(2024, 1, 1, tzinfo=UTC).isoformat()
+
+# Static part of a review row; only the IDs and overrides vary per record.
+_BASE_REVIEW: dict[str, Any] = {
+    "title": "Great Product",
+    "content": "This product is amazing and works perfectly.",
+    "category": "product",
+    "rating": 5,
+    "source": "https://example.com",
+    "summary_id": None,
+    "created_at": _FIXED_NOW,
+    "updated_at": _FIXED_NOW,
+}
+
+
 def _make_review_dict(
     review_id: UUID,
     author_id: UUID,
+    /,
     **overrides: Any,
-) -> Dict[str, Any]:
-    """Build a review record dictionary matching the Supabase row shape."""
-    now = datetime.utcnow().isoformat()
-    base: Dict[str, Any] = {
+) -> dict[str, Any]:
+    """Build a review record dictionary matching the Supabase row shape.
+
+    The IDs are positional-only so ``author_id`` may also be overridden
+    (e.g. with ``None``) by keyword.
+    """
+    return {
+        **_BASE_REVIEW,
         "id": str(review_id),
-        "title": "Great Product",
-        "content": "This product is amazing and works perfectly.",
-        "category": "product",
-        "rating": 5,
-        "source": "https://example.com",
         "author_id": str(author_id),
-        "summary_id": None,
-        "created_at": now,
-        "updated_at": now,
+        **overrides,
     }
-    base.update(overrides)
-    return base
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_repo() -> MagicMock:
-    """Return a mocked ReviewRepository."""
+    """Return a mocked ReviewRepository, specced once per module."""
     return MagicMock(spec=ReviewRepository)
 
 
+@pytest.fixture(autouse=True)
+def _reset_mock_repo(mock_repo: MagicMock) -> Iterator[None]:
+    """Clear calls, return values and side effects after each test."""
+    yield
+    mock_repo.reset_mock(return_value=True, side_effect=True)
+
+
 @pytest.fixture
 def service(mock_repo: MagicMock) -> ReviewService:
     """Return a ReviewService wired to the mocked repo."""
     return ReviewService(repo=mock_repo)
 
 
+# Tests only need *some* review/author ID; distinct IDs (e.g. another
+# user) are still generated where the test depends on them.
+_REVIEW_ID = uuid4()
+_AUTHOR_ID = uuid4()
+
+
 @pytest.fixture
 def review_id() -> UUID:
-    return uuid4()
+    return _REVIEW_ID
 
 
 @pytest.fixture
 def author_id() -> UUID:
-    return uuid4()
+    return _AUTHOR_ID
 
 
 # ---------------------------------------------------------------------------
 # create_review
 # ---------------------------------------------------------------------------
 
+
 class TestCreateReview:
     """Tests for ReviewService.create_review."""
 
@@ -123,6 +153,7 @@ class TestCreateReview:
 # get_review
 # ---------------------------------------------------------------------------
 
+
 class TestGetReview:
     """Tests for ReviewService.get_review."""
 
@@ -162,26 +193,33 @@ class TestGetReview:
 # list_reviews
 # ---------------------------------------------------------------------------
 
+
 class TestListReviews:
     """Tests for ReviewService.list_reviews."""
 
+    @pytest.mark.parametrize("n", [0, 1, 3], ids=["empty", "one", "several"])
     def test_list_reviews_no_filter(
         self,
         service: ReviewService,
         mock_repo: MagicMock,
         author_id: UUID,
+        n: int,
     ) -> None:
-        """list_reviews without category should call get_all."""
-        records = [_make_review_dict(uuid4(), author_id) for _ in range(3)]
-        mock_repo.get_all.return_value = (records, 3)
+        """list_reviews without category should call get_all.
+
+        A partial page (including an empty one) carries no next cursor.
+        """
+        records = [_make_review_dict(uuid4(), author_id) for _ in range(n)]
+        mock_repo.get_all.return_value = (records, n)
 
         result = service.list_reviews(page=1, per_page=20)
 
         assert isinstance(result, ReviewListResponse)
-        assert len(result.items) == 3
-        assert result.total == 3
+        assert len(result.items) == n
+        assert result.total == n
         assert result.page == 1
         assert result.per_page == 20
+        assert result.next_cursor is None
         mock_repo.get_all.assert_called_once_with(page=1, per_page=20)
 
     def test_list_reviews_with_category(
@@ -197,28 +235,170 @@ class TestListReviews:
         result = service.list_reviews(page=1, per_page=10, category="book")
 
         assert result.total == 1
-        mock_repo.get_by_category.assert_called_once_with(
-            "book", page=1, per_page=10
+        mock_repo.get_by_category.assert_called_once_with("book", page=1, per_page=10)
+
+    def test_list_reviews_full_page_has_next_cursor(
+        self,
+        service: ReviewService,
+        mock_repo: MagicMock,
+        author_id: UUID,
+    ) -> None:
+        """A full page should carry a cursor pointing past its last item."""
+        records = [_make_review_dict(uuid4(), author_id) for _ in range(2)]
+        mock_repo.get_all.return_value = (records, 5)
+
+        result = service.list_reviews(page=1, per_page=2)
+
+        assert result.next_cursor == encode_cursor(records[-1])
+
+    def test_list_reviews_with_cursor_uses_keyset(
+        self,
+        service: ReviewService,
+        mock_repo: MagicMock,
+        author_id: UUID,
+    ) -> None:
+        """list_reviews with a cursor should call get_after."""
+        records = [_make_review_dict(uuid4(), author_id)]
+        mock_repo.get_after.return_value = (records, 1)
+
+        result = service.list_reviews(per_page=10, category="book", cursor="abc")
+
+        assert len(result.items) == 1
+        mock_repo.get_after.assert_called_once_with("abc", per_page=10, category="book")
+        mock_repo.get_all.assert_not_called()
+
+    @pytest.mark.parametrize("n", [0, 10, 1000], ids=["empty", "small", "large"])
+    def test_list_reviews_validates_rows(
+        self,
+        service: ReviewService,
+        mock_repo: MagicMock,
+        n: int,
+    ) -> None:
+        """Rows of pages of any size should be parsed into typed fields."""
+        records = [_make_review_dict(uuid4(), uuid4()) for _ in range(n)]
+        mock_repo.get_all.return_value = (records, n)
+
+        result = service.list_reviews(page=1, per_page=1000)
+
+        assert len(result.items) == n
+        assert all(isinstance(item, ReviewResponse) for item in result.items)
+        assert all(isinstance(item.id, UUID) for item in result.items)
+        assert all(isinstance(item.created_at, datetime) for item in result.items)
+        assert result.next_cursor == (encode_cursor(records[-1]) if n == 1000 else None)
+
+    @pytest.mark.benchmark(group="service")
+    def test_list_reviews_perf(
+        self,
+        benchmark: Any,
+        service: ReviewService,
+        mock_repo: MagicMock,
+    ) -> None:
+        """Benchmark building a validated 1000-row page."""
+        records = [_make_review_dict(uuid4(), uuid4()) for _ in range(1000)]
+        mock_repo.get_all.return_value = (records, 1000)
+
+        result = benchmark(service.list_reviews, page=1, per_page=1000)
+
+        assert len(result.items) == 1000
+
+    def test_list_reviews_invalid_cursor(
+        self,
+        service: ReviewService,
+        mock_repo: MagicMock,
+    ) -> None:
+        """A malformed cursor should surface as a ValidationException."""
+        mock_repo.get_after.side_effect = ValueError("Malformed cursor")
+
+        with pytest.raises(ValidationException):
+            service.list_reviews(cursor="garbage")
+
+
+# ---------------------------------------------------------------------------
+# export
+# ---------------------------------------------------------------------------
+
+
+class TestExport:
+    """Tests for ReviewService.export."""
+
+    def test_export_streams_repository_rows(
+        self,
+        service: ReviewService,
+        mock_repo: MagicMock,
+        author_id: UUID,
+    ) -> None:
+        """export should pass rows from iter_all through untouched."""
+        records = [_make_review_dict(uuid4(), author_id) for _ in range(3)]
+        mock_repo.iter_all.return_value = iter(records)
+
+        result = list(service.export(category="book"))
+
+        assert result == records
+        mock_repo.iter_all.assert_called_once_with(category="book")
+
+
+# ---------------------------------------------------------------------------
+# update_review
+# ---------------------------------------------------------------------------
+
+
+class TestUpdateReview:
+    """Tests for ReviewService.update_review."""
+
+    def test_update_review_by_author(
+        self,
+        service: ReviewService,
+        mock_repo: MagicMock,
+        review_id: UUID,
+        author_id: UUID,
+    ) -> None:
+        """update_review should write once and return the updated row."""
+        mock_repo.update_if_author.return_value = _make_review_dict(
+            review_id, author_id, title="New Title"
         )
 
-    def test_list_reviews_empty(
+        result = service.update_review(review_id, {"title": "New Title"}, user_id=author_id)
+
+        assert result.title == "New Title"
+        mock_repo.update_if_author.assert_called_once_with(
+            review_id, author_id, {"title": "New Title"}
+        )
+        mock_repo.get_by_id.assert_not_called()
+
+    def test_update_review_not_author(
         self,
         service: ReviewService,
         mock_repo: MagicMock,
+        review_id: UUID,
+        author_id: UUID,
     ) -> None:
-        """list_reviews should return an empty list when no records exist."""
-        mock_repo.get_all.return_value = ([], 0)
+        """update_review should raise AuthorizationException for non-authors."""
+        mock_repo.update_if_author.return_value = None
+        mock_repo.get_by_id.return_value = _make_review_dict(review_id, author_id)
 
-        result = service.list_reviews()
+        with pytest.raises(AuthorizationException):
+            service.update_review(review_id, {"title": "X"}, user_id=uuid4())
+
+    def test_update_review_not_found(
+        self,
+        service: ReviewService,
+        mock_repo: MagicMock,
+        review_id: UUID,
+        author_id: UUID,
+    ) -> None:
+        """update_review should raise NotFoundException for missing reviews."""
+        mock_repo.update_if_author.return_value = None
+        mock_repo.get_by_id.return_value = None
 
-        assert result.items == []
-        assert result.total == 0
+        with pytest.raises(NotFoundException):
+            service.update_review(review_id, {"title": "X"}, user_id=author_id)
 
 
 # ---------------------------------------------------------------------------
 # delete_review
 # ---------------------------------------------------------------------------
 
+
 class TestDeleteReview:
     """Tests for ReviewService.delete_review."""
 
@@ -230,13 +410,13 @@ class TestDeleteReview:
         author_id: UUID,
     ) -> None:
         """delete_review should succeed when the requester is the author."""
-        mock_repo.get_by_id.return_value = _make_review_dict(review_id, author_id)
-        mock_repo.delete.return_value = True
+        mock_repo.delete_if_author.return_value = True
 
         result = service.delete_review(review_id, user_id=author_id)
 
         assert result is True
-        mock_repo.delete.assert_called_once_with(review_id)
+        mock_repo.delete_if_author.assert_called_once_with(review_id, author_id)
+        mock_repo.get_by_id.assert_not_called()
 
     def test_delete_review_not_author(
         self,
@@ -246,6 +426,7 @@ class TestDeleteReview:
         author_id: UUID,
     ) -> None:
         """delete_review should raise AuthorizationException for non-authors."""
+        mock_repo.delete_if_author.return_value = False
         mock_repo.get_by_id.return_value = _make_review_dict(review_id, author_id)
         other_user = uuid4()
 
@@ -262,6 +443,7 @@ class TestDeleteReview:
         author_id: UUID,
     ) -> None:
         """delete_review should raise NotFoundException for missing reviews."""
+        mock_repo.delete_if_author.return_value = False
         mock_repo.get_by_id.return_value = None
 
         with pytest.raises(NotFoundException):
@@ -0,0 +1,117 @@
+"""Unit tests for SummaryService with mocked repositories."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.core.exceptions import NotFoundException
+from app.dto.summary import SummaryResponse
+from app.repositories.review_repo import ReviewRepository
+from app.repositories.summary_repo import SummaryRepository
+from app.services.summary_service import SummaryService
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+_REVIEW_ID = uuid4()
+
+
+def _make_summary_dict(**overrides: Any) -> dict[str, Any]:
+    """Build a summary record dictionary matching the Supabase row shape."""
+    return {
+        "id": str(uuid4()),
+        "summary": "Overall positive review highlighting product quality.",
+        "sentiment": "positive",
+        "sentiment_score": 0.85,
+        "keywords": ["quality"],
+        "pros": ["Great build quality"],
+        "cons": [],
+        "ai_model": "gpt-4",
+        "created_at": datetime(2024, 1, 1, tzinfo=UTC).isoformat(),
+        **overrides,
+    }
+
+
+@pytest.fixture
+def summary_repo() -> MagicMock:
+    return MagicMock(spec=SummaryRepository)
+
+
+@pytest.fixture
+def review_repo() -> MagicMock:
+    return MagicMock(spec=ReviewRepository)
+
+
+@pytest.fixture
+def service(summary_repo: MagicMock, review_repo: MagicMock) -> SummaryService:
+    """Return a SummaryService wired to the mocked repos."""
+    return SummaryService(summary_repo=summary_repo, review_repo=review_repo)
+
+
+# ---------------------------------------------------------------------------
+# summarize_review
+# ---------------------------------------------------------------------------
+
+
+class TestSummarizeReview:
+    """Tests for SummaryService.summarize_review."""
+
+    def test_returns_linked_summary(
+        self,
+        service: SummaryService,
+        summary_repo: MagicMock,
+        review_repo: MagicMock,
+    ) -> None:
+        """An already linked summary should be returned without writes."""
+        linked = _make_summary_dict()
+        review_repo.get_with_summary.return_value = {
+            "title": "T",
+            "content": "C",
+            "summary": linked,
+        }
+
+        result = service.summarize_review(_REVIEW_ID)
+
+        assert isinstance(result, SummaryResponse)
+        assert result.id == UUID(linked["id"])
+        summary_repo.create.assert_not_called()
+        review_repo.update.assert_not_called()
+
+    def test_creates_and_links_summary(
+        self,
+        service: SummaryService,
+        summary_repo: MagicMock,
+        review_repo: MagicMock,
+    ) -> None:
+        """Without a linked summary, one should be created and linked."""
+        created = _make_summary_dict(sentiment="neutral", ai_model="placeholder")
+        review_repo.get_with_summary.return_value = {
+            "title": "Great Product",
+            "content": "Works perfectly.",
+            "summary": None,
+        }
+        summary_repo.create.return_value = created
+
+        result = service.summarize_review(_REVIEW_ID)
+
+        assert result.id == UUID(created["id"])
+        row = summary_repo.create.call_args.args[0]
+        assert row["summary"].startswith("AI-generated summary of: Great Product.")
+        review_repo.update.assert_called_once_with(_REVIEW_ID, {"summary_id": created["id"]})
+
+    def test_missing_review_raises(
+        self,
+        service: SummaryService,
+        review_repo: MagicMock,
+    ) -> None:
+        """A missing review should raise NotFoundException."""
+        review_repo.get_with_summary.return_value = None
+
+        with pytest.raises(NotFoundException):
+            service.summarize_review(_REVIEW_ID)